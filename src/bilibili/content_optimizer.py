@@ -392,7 +392,7 @@ class BilibiliContentOptimizer:
             result = response.choices[0].message.content.strip()
 
             # 记录模型原始输出（用于调试）
-            logger.debug(f"[LLM标题生成原始输出]\n{result}\n[/LLM标题生成原始输出]")
+            logger.debug("[LLM标题生成原始输出]\n%s\n[/LLM标题生成原始输出]", result)
 
             return result
 
@@ -705,7 +705,7 @@ class BilibiliContentOptimizer:
             result = response.choices[0].message.content.strip()
 
             # 记录模型原始输出（用于调试）
-            logger.debug(f"[LLM标签生成原始输出]\n{result}\n[/LLM标签生成原始输出]")
+            logger.debug("[LLM标签生成原始输出]\n%s\n[/LLM标签生成原始输出]", result)
 
             return result
 
@@ -9,6 +9,18 @@ from typing import Any, Dict, List, Optional, Tuple
 from ..utils.config import settings
 from ..utils.logger import logger
 
+# 中文字符（CJK统一表意文字基本区）
+_CJK_RE = re.compile(r"[\u4e00-\u9fff]")
+
+# 批次翻译结果中的序号行，如 "1. text" 或 "1: text"（分组：序号、分隔符、文本）
+_INDEX_LINE_RE = re.compile(r"(\d+)\s*([.:]) (.*)")
+
+# 单词（处理连续空格和标点符号）
+_WORD_RE = re.compile(r"\b[\w-]+\b")
+
+# 连续空白字符
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 class SubtitleProcessor:
     """字幕处理器"""
@@ -241,21 +253,9 @@ class SubtitleProcessor:
         try:
             logger.info(f"正在修复字幕时间轴重叠: {srt_path.name}")
 
-            # 解析字幕
+            # 解析字幕并修复重叠
             subtitles = self._parse_srt_file(srt_path)
-
-            # 修复重叠
-            for i in range(len(subtitles) - 1):
-                current_end = self._srt_time_to_ms(subtitles[i]["end"])
-                next_start = self._srt_time_to_ms(subtitles[i + 1]["start"])
-
-                if current_end >= next_start:
-                    # 调整当前字幕的结束时间，与下一条字幕间隔1帧
-                    new_end_ms = next_start - int(1000 / fps)
-                    subtitles[i]["end"] = self._ms_to_srt_time(new_end_ms)
-                    logger.debug(
-                        f"修复重叠: 字幕{i + 1}结束时间调整为 {subtitles[i]['end']}"
-                    )
+            self._fix_overlaps(subtitles, fps)
 
             # 生成输出路径
             output_path = srt_path.parent / f"{srt_path.stem}_fixed{srt_path.suffix}"
@@ -270,6 +270,28 @@ class SubtitleProcessor:
             logger.error(f"修复字幕时间轴失败: {str(e)}")
             raise
 
+    def _fix_overlaps(self, subtitles: List[Dict[str, Any]], fps: float = 60.0) -> None:
+        """修复字幕列表的时间轴重叠（原地修改）
+
+        Args:
+            subtitles: 字幕列表
+            fps: 帧率，用于计算最小间隔
+        """
+        frame_ms = int(1000 / fps)
+        debug = logger.is_debug()
+        for i in range(len(subtitles) - 1):
+            current_end = self._srt_time_to_ms(subtitles[i]["end"])
+            next_start = self._srt_time_to_ms(subtitles[i + 1]["start"])
+
+            if current_end >= next_start:
+                # 调整当前字幕的结束时间，与下一条字幕间隔1帧
+                new_end_ms = next_start - frame_ms
+                subtitles[i]["end"] = self._ms_to_srt_time(new_end_ms)
+                if debug:
+                    logger.debug(
+                        f"修复重叠: 字幕{i + 1}结束时间调整为 {subtitles[i]['end']}"
+                    )
+
     def merge_subtitle_lines(self, srt_path: Path) -> Path:
         """将字幕每两行合并为一行
 
@@ -291,59 +313,7 @@ class SubtitleProcessor:
             # 解析字幕
             subtitles = self._parse_srt_file(srt_path)
 
-            # 每两行合并为一行，但检查单词数
-            merged_subtitles = []
-            i = 0
-            while i < len(subtitles):
-                if i + 1 < len(subtitles):
-                    # 有两行，检查是否应该合并
-                    sub1 = subtitles[i]
-                    sub2 = subtitles[i + 1]
-
-                    # 计算合并后的单词数
-                    merged_text = f"{sub1['text']} {sub2['text']}"
-                    word_count = self._count_words(merged_text)
-
-                    if word_count > 15:
-                        # 合并后单词数过多，不合并
-                        logger.debug(
-                            f"合并后单词数过多({word_count}个)，不合并字幕{i + 1}和{i + 2}"
-                        )
-                        # 添加第一行
-                        merged_sub = {
-                            "index": len(merged_subtitles) + 1,
-                            "start": sub1["start"],
-                            "end": sub1["end"],
-                            "text": sub1["text"],
-                        }
-                        merged_subtitles.append(merged_sub)
-                        # 下一轮将处理第二行
-                        i += 1
-                    else:
-                        # 正常合并两行
-                        merged_sub = {
-                            "index": len(merged_subtitles) + 1,
-                            "start": sub1["start"],
-                            "end": sub2["end"],
-                            "text": merged_text,
-                        }
-                        merged_subtitles.append(merged_sub)
-                        logger.debug(
-                            f"合并: 字幕{i + 1}和{i + 2} -> 字幕{len(merged_subtitles)} ({word_count}个单词)"
-                        )
-                        i += 2
-                else:
-                    # 只剩一行，直接添加
-                    sub = subtitles[i]
-                    merged_sub = {
-                        "index": len(merged_subtitles) + 1,
-                        "start": sub["start"],
-                        "end": sub["end"],
-                        "text": sub["text"],
-                    }
-                    merged_subtitles.append(merged_sub)
-                    logger.debug(f"保留: 字幕{i + 1}（无法配对）")
-                    i += 1
+            merged_subtitles = self._merge_lines(subtitles)
 
             # 生成输出路径
             output_path = srt_path.parent / f"{srt_path.stem}_merged{srt_path.suffix}"
@@ -360,6 +330,75 @@ class SubtitleProcessor:
             logger.error(f"合并字幕行失败: {str(e)}")
             raise
 
+    def _merge_lines(self, subtitles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """将字幕列表每两行合并为一行（规则见 merge_subtitle_lines）
+
+        Args:
+            subtitles: 字幕列表
+
+        Returns:
+            合并后的字幕列表
+        """
+        # 每两行合并为一行，但检查单词数
+        merged_subtitles = []
+        debug = logger.is_debug()
+        i = 0
+        while i < len(subtitles):
+            if i + 1 < len(subtitles):
+                # 有两行，检查是否应该合并
+                sub1 = subtitles[i]
+                sub2 = subtitles[i + 1]
+
+                # 计算合并后的单词数
+                merged_text = f"{sub1['text']} {sub2['text']}"
+                word_count = self._count_words(merged_text)
+
+                if word_count > 15:
+                    # 合并后单词数过多，不合并
+                    if debug:
+                        logger.debug(
+                            f"合并后单词数过多({word_count}个)，不合并字幕{i + 1}和{i + 2}"
+                        )
+                    # 添加第一行
+                    merged_sub = {
+                        "index": len(merged_subtitles) + 1,
+                        "start": sub1["start"],
+                        "end": sub1["end"],
+                        "text": sub1["text"],
+                    }
+                    merged_subtitles.append(merged_sub)
+                    # 下一轮将处理第二行
+                    i += 1
+                else:
+                    # 正常合并两行
+                    merged_sub = {
+                        "index": len(merged_subtitles) + 1,
+                        "start": sub1["start"],
+                        "end": sub2["end"],
+                        "text": merged_text,
+                    }
+                    merged_subtitles.append(merged_sub)
+                    if debug:
+                        logger.debug(
+                            f"合并: 字幕{i + 1}和{i + 2} -> 字幕{len(merged_subtitles)} ({word_count}个单词)"
+                        )
+                    i += 2
+            else:
+                # 只剩一行，直接添加
+                sub = subtitles[i]
+                merged_sub = {
+                    "index": len(merged_subtitles) + 1,
+                    "start": sub["start"],
+                    "end": sub["end"],
+                    "text": sub["text"],
+                }
+                merged_subtitles.append(merged_sub)
+                if debug:
+                    logger.debug(f"保留: 字幕{i + 1}（无法配对）")
+                i += 1
+
+        return merged_subtitles
+
     def _count_words(self, text: str) -> int:
         """计算文本中的单词数量（按空格分割）
 
@@ -369,9 +408,18 @@ class SubtitleProcessor:
         Returns:
             单词数量
         """
-        # 使用正则表达式分割单词，处理连续空格和标点符号
-        words = re.findall(r"\b[\w-]+\b", text)
-        return len(words)
+        return len(_WORD_RE.findall(text))
+
+    def _count_chinese_characters(self, text: str) -> int:
+        """计算文本中的中文字符数量
+
+        Args:
+            text: 待统计的文本
+
+        Returns:
+            中文字符数量
+        """
+        return len(_CJK_RE.findall(text))
 
     def _write_srt_file(
         self, subtitles: List[Dict[str, Any]], output_path: Path
@@ -382,14 +430,12 @@ class SubtitleProcessor:
             subtitles: 字幕列表
             output_path: 输出文件路径
         """
-        lines = []
-        for sub in subtitles:
-            lines.append(str(sub["index"]))
-            lines.append(f"{sub['start']} --> {sub['end']}")
-            lines.append(sub["text"])
-            lines.append("")  # 空行分隔
-
-        output_path.write_text("\n".join(lines), encoding="utf-8")
+        # 每条字幕一次性格式化为完整块，块之间以空行分隔
+        content = "\n".join(
+            f"{sub['index']}\n{sub['start']} --> {sub['end']}\n{sub['text']}\n"
+            for sub in subtitles
+        )
+        output_path.write_text(content, encoding="utf-8")
 
     async def translate_with_openai(
         self, subtitle_path: Path, output_path: Optional[Path] = None
@@ -419,17 +465,17 @@ class SubtitleProcessor:
 
             logger.info(f"基础文件名: {base_stem}")
 
-            # 步骤1: 修复字幕时间轴重叠（生成临时文件）
+            # 预处理全部在内存中完成：只解析一次原文件，不再写出/重新解析临时文件
+            subtitles = self._parse_srt_file(subtitle_path)
+
+            # 步骤1: 修复字幕时间轴重叠
             logger.info("步骤 1/4: 修复字幕时间轴重叠...")
-            fixed_subtitle_path = self.fix_subtitle_overlaps(subtitle_path)
+            self._fix_overlaps(subtitles)
 
-            # 步骤2: 合并字幕行（每两行合并为一行），保留原文件
+            # 步骤2: 合并字幕行（每两行合并为一行）
             logger.info("步骤 2/4: 合并字幕行...")
-            merged_subtitle_path = self.merge_subtitle_lines(fixed_subtitle_path)
-
-            # 删除临时的fixed文件
-            fixed_subtitle_path.unlink()
-            logger.info(f"预处理字幕完成: {merged_subtitle_path.name}")
+            subtitles = self._merge_lines(subtitles)
+            logger.info(f"预处理字幕完成: {len(subtitles)} 条")
 
             # 检查OpenAI API密钥
             api_key = settings.openai_api_key
@@ -451,8 +497,6 @@ class SubtitleProcessor:
 
             prompt_template = prompt_path.read_text(encoding="utf-8")
 
-            # 解析字幕为结构化数据（使用预处理后的文件）
-            subtitles = self._parse_srt_file(merged_subtitle_path)
             total_subtitles = len(subtitles)
             logger.info(f"解析到 {total_subtitles} 条字幕")
 
@@ -479,6 +523,11 @@ class SubtitleProcessor:
                         f"翻译第 {batch_num}/{total_batches} 批 ({i + 1}-{end_idx} 条)..."
                     )
 
+                    # 格式化当前批次的字幕（始终翻译整个批次，重试时复用）
+                    batch_text = self._format_subtitles_for_translation_batch(
+                        batch_subtitles, i
+                    )
+
                     # 重试机制：最多重试5次
                     max_retries = 5
                     translated_map = {}
@@ -491,11 +540,6 @@ class SubtitleProcessor:
                                 f"第 {batch_num} 批第 {retry_count}/{max_retries} 次重试，重新翻译整个批次..."
                             )
 
-                        # 格式化当前批次的字幕（始终翻译整个批次）
-                        batch_text = self._format_subtitles_for_translation_batch(
-                            batch_subtitles, i
-                        )
-
                         # 调用API翻译当前批次
                         translated_batch = await self._call_openai_translate(
                             prompt_template, batch_text, api_key, base_url, model
@@ -577,9 +621,6 @@ class SubtitleProcessor:
                 # 保存翻译结果
                 output_path.write_text(final_content, encoding="utf-8")
 
-                # 删除临时的预处理文件
-                merged_subtitle_path.unlink()
-
                 logger.info(f"字幕翻译完成: {output_path.name}")
                 return output_path
 
@@ -603,7 +644,14 @@ class SubtitleProcessor:
         Returns:
             字幕条目列表，每条包含 index, start, end, text
         """
-        content = srt_path.read_text(encoding="utf-8")
+        return self._parse_srt_text(srt_path.read_text(encoding="utf-8"))
+
+    def _parse_srt_text(self, content: str) -> List[Dict[str, Any]]:
+        """解析 SRT 字幕文本为结构化数据
+
+        Returns:
+            字幕条目列表，每条包含 index, start, end, text
+        """
         entries = []
 
         blocks = content.strip().split("\n\n")
@@ -641,7 +689,7 @@ class SubtitleProcessor:
         for i, sub in enumerate(subtitles):
             seq_num = offset + i + 1
             # 将多行文本合并成一行，使用正则表达式将连续空白字符替换为单个空格
-            text = re.sub(r"\s+", " ", sub["text"].strip())
+            text = _WHITESPACE_RE.sub(" ", sub["text"].strip())
             lines.append(f"{seq_num}: {text}")
         return "\n".join(lines)
 
@@ -669,76 +717,38 @@ class SubtitleProcessor:
             line = lines[i].strip()
 
             # 跳过空行和注释行
-            if (
-                not line
-                or line.startswith("#")
-                or line.startswith("Note")
-                or line.startswith("注意")
-            ):
+            if not line or line.startswith(("#", "Note", "注意")):
                 i += 1
                 continue
 
             # 检查序号行（使用.或:作为分隔符）
-            index = None
-            first_part_text = None
-            separator = None
-
-            # 尝试.分隔符
-            if ". " in line:
-                parts = line.split(". ", 1)
-                index_str = parts[0].strip()
-                if index_str.isdigit():
-                    separator = "."
-                    index = int(index_str)
-                    first_part_text = parts[1].strip() if len(parts) > 1 else ""
-
-            # 尝试:分隔符（如果.没找到）
-            if index is None and ": " in line:
-                parts = line.split(": ", 1)
-                index_str = parts[0].strip()
-                if index_str.isdigit():
-                    separator = ":"
-                    index = int(index_str)
-                    first_part_text = parts[1].strip() if len(parts) > 1 else ""
+            match = _INDEX_LINE_RE.match(line)
+            first_part_text = match.group(3).strip() if match else ""
 
             # 如果找到了序号行
-            if index is not None and first_part_text:
+            if first_part_text:
+                index = int(match.group(1))
+                separator = match.group(2)
+
                 # 查找下一行的中文翻译
                 second_part_text = ""
                 if i + 1 < len(lines):
                     next_line = lines[i + 1].strip()
-
-                    # 检查下一行是否是相同序号的中文翻译（带序号）
-                    if separator and f"{separator} " in next_line:
-                        next_parts = next_line.split(f"{separator} ", 1)
-                        next_index_str = next_parts[0].strip()
-                        if next_index_str.isdigit() and int(next_index_str) == index:
-                            second_part_text = (
-                                next_parts[1].strip() if len(next_parts) > 1 else ""
-                            )
-
-                    # 如果下一行不是带序号的中文，检查是否是不带序号的中文
-                    if not second_part_text and next_line:
-                        # 判断是否是另一个序号行
-                        is_next_index_line = False
-                        if ". " in next_line:
-                            potential_index = next_line.split(". ", 1)[0].strip()
-                            is_next_index_line = potential_index.isdigit()
-                        elif ": " in next_line:
-                            potential_index = next_line.split(": ", 1)[0].strip()
-                            is_next_index_line = potential_index.isdigit()
-
-                        # 如果不是下一个序号行，且不是注释，则认为是中文翻译
-                        if not is_next_index_line and not next_line.startswith("#"):
-                            second_part_text = next_line
-
-                    # 根据是否有第二行决定跳过的行数
-                    if second_part_text:
-                        i += 2  # 跳过两行
-                    else:
-                        i += 1
-                else:
-                    i += 1
+                    next_match = _INDEX_LINE_RE.match(next_line)
+
+                    if next_match:
+                        # 下一行是相同序号的中文翻译（带序号），否则是下一条字幕
+                        if (
+                            next_match.group(2) == separator
+                            and int(next_match.group(1)) == index
+                        ):
+                            second_part_text = next_match.group(3).strip()
+                    elif next_line and not next_line.startswith("#"):
+                        # 不带序号且不是注释，则认为是中文翻译
+                        second_part_text = next_line
+
+                # 根据是否有第二行决定跳过的行数
+                i += 2 if second_part_text else 1
 
                 # 构建结果文本
                 if second_part_text:
@@ -788,7 +798,7 @@ class SubtitleProcessor:
 
         支持双语格式：translated_texts 中的每个元素可以包含换行符分隔的英中双语文本
         """
-        lines = []
+        blocks = []
 
         for i, sub in enumerate(subtitles):
             if i >= len(translated_texts):
@@ -797,12 +807,12 @@ class SubtitleProcessor:
             else:
                 translated_text = translated_texts[i]
 
-            lines.append(str(sub["index"]))
-            lines.append(f"{sub['start']} --> {sub['end']}")
-            lines.append(translated_text)
-            lines.append("")
+            # 每条字幕一次性格式化为完整块，块之间以空行分隔
+            blocks.append(
+                f"{sub['index']}\n{sub['start']} --> {sub['end']}\n{translated_text}\n"
+            )
 
-        return "\n".join(lines)
+        return "\n".join(blocks)
 
     def _format_subtitles_for_translation(self, subtitles: List[Dict[str, Any]]) -> str:
         """格式化字幕用于翻译"""
@@ -847,7 +857,7 @@ class SubtitleProcessor:
             translated_text = response.choices[0].message.content.strip()
 
             # 记录模型原始输出（用于调试）
-            logger.debug(f"[模型原始输出]\n{translated_text}\n[/模型原始输出]")
+            logger.debug("[模型原始输出]\n%s\n[/模型原始输出]", translated_text)
 
             return translated_text
 
@@ -1191,9 +1201,7 @@ Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text
 
                 for line in text_lines:
                     # 检测是否为中文（包含中文字符）
-                    has_chinese = any("\u4e00" <= char <= "\u9fff" for char in line)
-
-                    if has_chinese:
+                    if _CJK_RE.search(line):
                         # 中文字幕使用 Chinese 样式（圆体、白字蓝色描边）
                         chinese_lines.append(line)
                     else:
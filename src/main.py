@@ -2,6 +2,7 @@
 
 import asyncio
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import Optional, List
@@ -33,6 +34,9 @@ from .bilibili.content_optimizer import BilibiliContentOptimizer
 from .core.subtitle_processor import SubtitleProcessor
 import re
 
+# 支持的视频扩展名
+VIDEO_EXTENSIONS = (".mp4", ".mkv", ".webm", ".avi", ".mov", ".flv")
+
 
 class LocalVideo:
     """本地视频信息"""
@@ -129,7 +133,8 @@ class YouTubeToBilibili:
         """
         history_file = self._get_subscription_history_file()
 
-        # 加载现有历史记录
+        # 加载现有历史记录（保留订阅监控器写入的其他字段，如 feed_etags）
+        data = {}
         processed_videos = set()
         if history_file.exists():
             try:
@@ -149,11 +154,10 @@ class YouTubeToBilibili:
                 import json
                 from datetime import datetime
                 history_file.parent.mkdir(parents=True, exist_ok=True)
+                data["processed_videos"] = list(processed_videos)
+                data["last_updated"] = datetime.now().isoformat()
                 with open(history_file, "w", encoding="utf-8") as f:
-                    json.dump({
-                        "processed_videos": list(processed_videos),
-                        "last_updated": datetime.now().isoformat(),
-                    }, f, ensure_ascii=False, indent=2)
+                    json.dump(data, f, ensure_ascii=False, indent=2)
                 logger.info(f"已添加视频到历史记录: {video_id}")
             except Exception as e:
                 logger.error(f"保存历史记录失败: {e}")
@@ -227,81 +231,7 @@ class YouTubeToBilibili:
                 return []
 
             # 下载视频
-            downloaded_videos = []
-
-            if RICH_AVAILABLE:
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TaskProgressColumn(),
-                    console=self.console,
-                ) as progress:
-                    for i, video in enumerate(selected_videos):
-                        task = progress.add_task(
-                            f"下载: {video.title[:30]}...", total=100
-                        )
-
-                        def update_progress(percent, speed):
-                            progress.update(task, completed=percent)
-
-                        try:
-                            downloaded_path = await self.downloader.download_video(
-                                video, update_progress
-                            )
-
-                            if downloaded_path:
-                                video.downloaded_path = str(downloaded_path)
-                                downloaded_videos.append(video)
-                                progress.update(task, completed=100)
-                                self.console.print(
-                                    f"✅ 下载完成: {downloaded_path.name}",
-                                    style="green",
-                                )
-
-                                # 翻译字幕（如果启用）
-                                if self.translate_subs:
-                                    await self.translate_video_subtitles(downloaded_path, video.url)
-                            else:
-                                self.console.print(
-                                    f"❌ 下载失败: {video.title}", style="red"
-                                )
-
-                        except Exception as e:
-                            logger.error(f"下载视频失败: {video.title}, 错误: {str(e)}")
-                            self.console.print(
-                                f"❌ 下载异常: {video.title}", style="red"
-                            )
-                            continue
-            else:
-                for i, video in enumerate(selected_videos):
-                    try:
-                        print(
-                            f"📥 下载中 ({i + 1}/{len(selected_videos)}): {video.title[:50]}..."
-                        )
-
-                        downloaded_path = await self.downloader.download_video(video)
-
-                        if downloaded_path:
-                            video.downloaded_path = str(downloaded_path)
-                            downloaded_videos.append(video)
-                            print(f"✅ 下载完成: {downloaded_path.name}")
-
-                            # 翻译字幕（如果启用）
-                            if self.translate_subs:
-                                await self.translate_video_subtitles(downloaded_path, video.url)
-                        else:
-                            print(f"❌ 下载失败: {video.title}")
-
-                    except Exception as e:
-                        logger.error(f"下载视频失败: {video.title}, 错误: {str(e)}")
-                        print(f"❌ 下载异常: {video.title}")
-                        continue
-
-            self.console.print(
-                f"🎉 成功下载 {len(downloaded_videos)} 个视频", style="green"
-            )
-            return downloaded_videos
+            return await self._download_videos_direct(selected_videos)
 
         except Exception as e:
             import traceback
@@ -553,12 +483,13 @@ class YouTubeToBilibili:
             return []
 
     async def _download_videos_direct(self, videos: List[YouTubeVideo]) -> List[YouTubeVideo]:
-        """直接下载视频列表（不交互）"""
+        """直接下载视频列表（不交互）
+
+        视频并发下载（并发数见 DOWNLOAD_CONCURRENCY），全部下载结束后按原顺序处理结果
+        """
         downloaded_videos = []
 
         if RICH_AVAILABLE:
-            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-
             with Progress(
                 SpinnerColumn(),
                 TextColumn("[progress.description]{task.description}"),
@@ -566,66 +497,40 @@ class YouTubeToBilibili:
                 TaskProgressColumn(),
                 console=self.console,
             ) as progress:
-                for i, video in enumerate(videos):
-                    task = progress.add_task(
+                tasks = {
+                    id(video): progress.add_task(
                         f"下载: {video.title[:30]}...", total=100
                     )
+                    for video in videos
+                }
 
-                    def update_progress(percent, speed):
-                        progress.update(task, completed=percent)
+                def update_progress(video, percent, speed):
+                    progress.update(tasks[id(video)], completed=percent)
 
-                    try:
-                        downloaded_path = await self.downloader.download_video(
-                            video, update_progress
-                        )
-
-                        if downloaded_path:
-                            video.downloaded_path = str(downloaded_path)
-                            downloaded_videos.append(video)
-                            progress.update(task, completed=100)
-                            self.console.print(
-                                f"✅ 下载完成: {downloaded_path.name}",
-                                style="green",
-                            )
-
-                            # 翻译字幕（如果启用）
-                            if self.translate_subs:
-                                await self.translate_video_subtitles(downloaded_path, video.url)
-                        else:
-                            self.console.print(
-                                f"❌ 下载失败: {video.title}", style="red"
-                            )
-
-                    except Exception as e:
-                        logger.error(f"下载视频失败: {video.title}, 错误: {str(e)}")
-                        self.console.print(
-                            f"❌ 下载异常: {video.title}", style="red"
-                        )
-                        continue
+                results = await self.downloader.download_many(videos, update_progress)
         else:
-            for i, video in enumerate(videos):
-                try:
-                    print(
-                        f"📥 下载中 ({i + 1}/{len(videos)}): {video.title[:50]}..."
-                    )
+            print(f"📥 下载中 (共{len(videos)}个视频)...")
+            results = await self.downloader.download_many(videos)
 
-                    downloaded_path = await self.downloader.download_video(video)
-
-                    if downloaded_path:
-                        video.downloaded_path = str(downloaded_path)
-                        downloaded_videos.append(video)
-                        print(f"✅ 下载完成: {downloaded_path.name}")
+        for video, downloaded_path in zip(videos, results, strict=True):
+            try:
+                if downloaded_path:
+                    video.downloaded_path = str(downloaded_path)
+                    downloaded_videos.append(video)
+                    self.console.print(
+                        f"✅ 下载完成: {downloaded_path.name}", style="green"
+                    )
 
-                        # 翻译字幕（如果启用）
-                        if self.translate_subs:
-                            await self.translate_video_subtitles(downloaded_path, video.url)
-                    else:
-                        print(f"❌ 下载失败: {video.title}")
+                    # 翻译字幕（如果启用）
+                    if self.translate_subs:
+                        await self.translate_video_subtitles(downloaded_path, video.url)
+                else:
+                    self.console.print(f"❌ 下载失败: {video.title}", style="red")
 
-                except Exception as e:
-                    logger.error(f"下载视频失败: {video.title}, 错误: {str(e)}")
-                    print(f"❌ 下载异常: {video.title}")
-                    continue
+            except Exception as e:
+                logger.error(f"处理下载视频失败: {video.title}, 错误: {str(e)}")
+                self.console.print(f"❌ 下载异常: {video.title}", style="red")
+                continue
 
         self.console.print(
             f"🎉 成功下载 {len(downloaded_videos)} 个视频", style="green"
@@ -1711,8 +1616,7 @@ class YouTubeToBilibili:
                 return
 
             # 构建文件夹路径
-            download_path = Path(settings.download_path)
-            folder_path = download_path / folder_name
+            folder_path = settings.download_path_p / folder_name
 
             if not folder_path.exists():
                 self.console.print(f"❌ 文件夹不存在: {folder_name}", style="red")
@@ -1725,20 +1629,23 @@ class YouTubeToBilibili:
 
             self.console.print(f"📂 文件夹: {folder_name}")
 
-            # 查找视频文件
-            video_files = []
-            for ext in [".mp4", ".mkv", ".webm", ".avi", ".mov", ".flv"]:
-                video_files.extend(folder_path.glob(f"*{ext}"))
-
-            # 优先选择已嵌入字幕的视频（不带 _original 的）
-            non_original_videos = [v for v in video_files if not v.stem.endswith("_original")]
-            if non_original_videos:
-                video_path = non_original_videos[0]
-            elif video_files:
-                video_path = video_files[0]
-            else:
+            # 查找视频文件：单次扫描，优先选择已嵌入字幕的视频（不带 _original 的），
+            # 其次按 VIDEO_EXTENSIONS 的顺序（优先 .mp4）
+            candidates = []
+            with os.scandir(folder_path) as it:
+                for entry in it:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext not in VIDEO_EXTENSIONS or not entry.is_file():
+                        continue
+                    is_original = stem.endswith("_original")
+                    candidates.append(
+                        (is_original, VIDEO_EXTENSIONS.index(ext), entry.path)
+                    )
+
+            if not candidates:
                 self.console.print(f"❌ 文件夹中未找到视频文件", style="red")
                 return
+            video_path = Path(min(candidates)[2])
 
             self.console.print(f"🎬 视频文件: {video_path.name}")
 
@@ -1785,8 +1692,10 @@ class YouTubeToBilibili:
 
             # 确认上传
             self.console.print(f"\n⚠️  准备上传到B站", style="yellow")
-            from rich.prompt import Confirm
-            if not Confirm.ask("是否继续？"):
+            # 模拟模式或非交互终端（crontab、管道输入）下跳过确认，避免阻塞
+            if self.dry_run or not sys.stdin.isatty():
+                logger.info("非交互模式，跳过上传确认")
+            elif not Confirm.ask("是否继续？"):
                 self.console.print("已取消上传", style="yellow")
                 return
 
@@ -1799,9 +1708,7 @@ class YouTubeToBilibili:
             self.console.print("\n程序被用户中断", style="yellow")
         except Exception as e:
             self.console.print(f"❌ 程序执行异常: {str(e)}", style="red")
-            logger.error(f"程序执行异常: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"程序执行异常: {str(e)}")
 
 
 # CLI入口点
@@ -5,13 +5,31 @@
 """
 
 import asyncio
+import functools
 import json
+import os
+import re
+import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, Any, FrozenSet, Optional, Set
 from datetime import datetime
 import argparse
 import sys
 
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 from .utils.logger import logger
 from .utils.config import settings
 from .youtube.searcher import YouTubeSearcher
@@ -48,6 +66,16 @@ class SubscriptionMonitor:
     # 每个频道获取的最新视频数量
     VIDEOS_PER_CHANNEL = 3
 
+    # 频道RSS订阅地址（无需API配额，返回最近15个视频）
+    RSS_FEED_URL = "https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"
+
+    # RSS XML命名空间
+    RSS_NAMESPACES = {
+        "atom": "http://www.w3.org/2005/Atom",
+        "yt": "http://www.youtube.com/xml/schemas/2015",
+        "media": "http://search.yahoo.com/mrss/",
+    }
+
     def __init__(
         self,
         translate_subs: bool = True,
@@ -68,9 +96,15 @@ class SubscriptionMonitor:
             embed_subs=embed_subs,
         )
 
+        # 频道RSS的ETag缓存 {频道ID: ETag}，随历史记录一起持久化
+        self.feed_etags: Dict[str, str] = {}
+
         # 加载历史记录
         self.processed_videos: Set[str] = self._load_history()
 
+        # 已处理视频ID的只读快照，供检查新视频时的成员判断使用（每次 run_once 刷新）
+        self._processed_snapshot: FrozenSet[str] = frozenset(self.processed_videos)
+
     def _load_history(self) -> Set[str]:
         """从文件加载已处理视频ID集合"""
         if self.HISTORY_FILE.exists():
@@ -78,6 +112,7 @@ class SubscriptionMonitor:
                 with open(self.HISTORY_FILE, "r", encoding="utf-8") as f:
                     data = json.load(f)
                     processed = set(data.get("processed_videos", []))
+                    self.feed_etags = dict(data.get("feed_etags", {}))
                     logger.info(f"成功加载历史记录: {len(processed)} 个已处理视频")
                     return processed
             except json.JSONDecodeError as e:
@@ -105,6 +140,7 @@ class SubscriptionMonitor:
             with open(self.HISTORY_FILE, "w", encoding="utf-8") as f:
                 json.dump({
                     "processed_videos": list(self.processed_videos),
+                    "feed_etags": self.feed_etags,
                     "last_updated": datetime.now().isoformat(),
                 }, f, ensure_ascii=False, indent=2)
         except Exception as e:
@@ -132,21 +168,20 @@ class SubscriptionMonitor:
             return youtubers
 
         try:
-            with open(self.YOUTUBERS_FILE, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    # 跳过空行和注释
-                    if not line or line.startswith("#"):
-                        continue
-
-                    # 提取频道标识符
-                    channel_id = self._extract_channel_identifier(line)
-                    if channel_id:
-                        youtubers.append({
-                            "channel_id": channel_id,
-                            "title": channel_id,  # 标题后续会更新
-                            "url": line,
-                        })
+            lines = self.YOUTUBERS_FILE.read_text(encoding="utf-8").splitlines()
+            # 跳过空行和注释
+            for line in (ln.strip() for ln in lines):
+                if not line or line[0] == "#":
+                    continue
+
+                # 提取频道标识符
+                channel_id = self._extract_channel_identifier(line)
+                if channel_id:
+                    youtubers.append({
+                        "channel_id": channel_id,
+                        "title": channel_id,  # 标题后续会更新
+                        "url": line,
+                    })
 
             logger.info(f"从 {self.YOUTUBERS_FILE} 加载了 {len(youtubers)} 个YouTuber")
         except Exception as e:
@@ -154,10 +189,10 @@ class SubscriptionMonitor:
 
         return youtubers
 
-    def _extract_channel_identifier(self, line: str) -> Optional[str]:
-        """从行中提取频道标识符"""
-        import re
-
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _extract_channel_identifier(line: str) -> Optional[str]:
+        """从行中提取频道标识符（结果按行缓存）"""
         # 如果是URL，提取频道部分
         if line.startswith("http"):
             patterns = [
@@ -209,38 +244,57 @@ class SubscriptionMonitor:
             新视频列表（未在历史记录中的）
         """
         new_videos = []
+        etags_before = dict(self.feed_etags)
 
-        for youtuber in youtubers:
-            channel_id = youtuber.get("channel_id", "")
-            channel_title = youtuber.get("title", "Unknown")
-
-            if not channel_id:
-                continue
-
-            try:
-                logger.info(f"检查频道: {channel_title}")
-
-                # 获取频道最近视频
-                videos = await self.searcher.search_by_channel(
-                    channel_id,
-                    max_results=self.VIDEOS_PER_CHANNEL,
-                    order="date"
-                )
+        session = aiohttp.ClientSession() if AIOHTTP_AVAILABLE else None
+        try:
+            for youtuber in youtubers:
+                channel_id = youtuber.get("channel_id", "")
+                channel_title = youtuber.get("title", "Unknown")
 
-                # 筛选出未处理的视频
-                unprocessed_videos = [
-                    video for video in videos
-                    if video.video_id not in self.processed_videos
-                ]
+                if not channel_id:
+                    continue
 
-                # 处理所有新视频
-                for video in unprocessed_videos:
-                    new_videos.append(video)
-                    logger.info(f"  发现新视频: {video.title}")
+                try:
+                    logger.info(f"检查频道: {channel_title}")
+
+                    # 优先使用RSS获取频道最近视频（仅支持UC...频道ID）
+                    videos = None
+                    if session is not None and channel_id.startswith("UC"):
+                        videos = await self._rss_latest(session, channel_id)
+
+                    # RSS不可用或失败时降级到搜索器
+                    if videos is None:
+                        videos = await self.searcher.search_by_channel(
+                            channel_id,
+                            max_results=self.VIDEOS_PER_CHANNEL,
+                            order="date"
+                        )
+
+                    # 筛选出未处理的视频
+                    unprocessed_videos = [
+                        video for video in videos
+                        if video.video_id not in self._processed_snapshot
+                    ]
+
+                    # 有新视频时丢弃ETag，保证处理失败的视频下次仍能被发现
+                    if unprocessed_videos:
+                        self.feed_etags.pop(channel_id, None)
+
+                    # 处理所有新视频
+                    for video in unprocessed_videos:
+                        new_videos.append(video)
+                        logger.info(f"  发现新视频: {video.title}")
+
+                except Exception as e:
+                    logger.error(f"检查频道 {channel_title} 失败: {e}")
+                    continue
+        finally:
+            if session is not None:
+                await session.close()
 
-            except Exception as e:
-                logger.error(f"检查频道 {channel_title} 失败: {e}")
-                continue
+        if self.feed_etags != etags_before:
+            self._save_history()
 
         if self.console:
             self.console.print(f"✅ 共发现 [green]{len(new_videos)}[/green] 个新视频")
@@ -249,6 +303,112 @@ class SubscriptionMonitor:
 
         return new_videos
 
+    async def _rss_latest(
+        self, session: "aiohttp.ClientSession", channel_id: str
+    ) -> Optional[List[YouTubeVideo]]:
+        """通过频道RSS获取最近视频
+
+        使用 If-None-Match 发送缓存的ETag，频道无更新时服务器返回304。
+        与 search_by_channel 走API时一致，只保留计算机相关的视频。
+
+        Args:
+            session: 复用的HTTP会话
+            channel_id: UC开头的频道ID
+
+        Returns:
+            最近的计算机相关视频列表（304时为空列表），请求或解析失败时返回None
+        """
+        headers = {}
+        etag = self.feed_etags.get(channel_id)
+        if etag:
+            headers["If-None-Match"] = etag
+
+        try:
+            async with session.get(
+                self.RSS_FEED_URL.format(channel_id=channel_id),
+                headers=headers,
+                proxy=settings.proxy,
+                timeout=aiohttp.ClientTimeout(total=30),
+            ) as response:
+                if response.status == 304:
+                    logger.debug(f"频道RSS未更新: {channel_id}")
+                    return []
+                if response.status != 200:
+                    logger.warning(f"获取频道RSS失败 ({response.status}): {channel_id}")
+                    return None
+                body = await response.read()
+                new_etag = response.headers.get("ETag")
+        except Exception as e:
+            logger.warning(f"获取频道RSS失败: {channel_id}, {e}")
+            return None
+
+        videos = self._parse_rss_feed(body, channel_id)
+        if videos is None:
+            return None
+
+        # RSS不经过API详情筛选，这里按标题/描述过滤掉非计算机相关的视频
+        videos = [v for v in videos if v.is_computer_science_related()]
+
+        # 仅在最近（相关）视频均已处理时缓存ETag
+        if new_etag and all(v.video_id in self._processed_snapshot for v in videos):
+            self.feed_etags[channel_id] = new_etag
+
+        return videos
+
+    def _parse_rss_feed(
+        self, body: bytes, channel_id: str
+    ) -> Optional[List[YouTubeVideo]]:
+        """解析频道RSS内容为视频列表"""
+        try:
+            root = ET.fromstring(body)
+        except ET.ParseError as e:
+            logger.warning(f"解析频道RSS失败: {channel_id}, {e}")
+            return None
+
+        ns = self.RSS_NAMESPACES
+        channel_title = root.findtext("atom:author/atom:name", "", ns) or channel_id
+
+        videos = []
+        for entry in root.findall("atom:entry", ns)[: self.VIDEOS_PER_CHANNEL]:
+            video_id = entry.findtext("yt:videoId", "", ns)
+            if not video_id:
+                continue
+
+            # Shorts 的链接为 /shorts/ 形式，不做搬运
+            link = entry.find("atom:link", ns)
+            if link is not None and "/shorts/" in link.get("href", ""):
+                continue
+
+            published = entry.findtext("atom:published", "", ns)
+            try:
+                published_at = datetime.fromisoformat(published)
+            except ValueError:
+                published_at = datetime.now()
+
+            thumbnail = entry.find("media:group/media:thumbnail", ns)
+            statistics = entry.find("media:group/media:community/media:statistics", ns)
+
+            videos.append(
+                YouTubeVideo(
+                    video_id=video_id,
+                    title=entry.findtext("atom:title", "", ns),
+                    description=entry.findtext("media:group/media:description", "", ns),
+                    channel_title=entry.findtext("atom:author/atom:name", "", ns)
+                    or channel_title,
+                    channel_id=entry.findtext("yt:channelId", "", ns) or channel_id,
+                    published_at=published_at,
+                    view_count=int(statistics.get("views", 0))
+                    if statistics is not None
+                    else 0,
+                    thumbnail_url=thumbnail.get("url")
+                    if thumbnail is not None
+                    else None,
+                    language="en",
+                )
+            )
+
+        return videos
+
     async def process_video(self, video: YouTubeVideo, retry: bool = False) -> bool:
         """处理单个视频 - 使用 full workflow
 
@@ -291,9 +451,7 @@ class SubscriptionMonitor:
                 self.console.print(f"[red]✗[/red] {prefix}失败: {e}")
             else:
                 print(f"✗ {prefix}失败: {e}")
-            logger.error(f"{prefix}视频失败 {video.video_id}: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"{prefix}视频失败 {video.video_id}: {e}")
             return False
 
     async def process_queue(self, videos: List[YouTubeVideo]):
@@ -335,10 +493,66 @@ class SubscriptionMonitor:
         else:
             print("\n✓ 队列处理完成！")
 
+    def _acquire_lock(self) -> bool:
+        """获取单例锁
+
+        支持 fcntl 的平台上对 UPDATING_FILE 加 flock，进程退出（包括被强制结束）
+        时由内核自动释放；否则退回到检查标记文件是否存在。
+
+        Returns:
+            是否成功获取锁（False 表示已有其他实例在运行）
+        """
+        self._lock_fd: Optional[int] = None
+        info = f"PID: {os.getpid()}\nStarted: {datetime.now().isoformat()}\n"
+
+        if FCNTL_AVAILABLE:
+            try:
+                fd = os.open(self.UPDATING_FILE, os.O_CREAT | os.O_RDWR, 0o644)
+            except OSError as e:
+                logger.error(f"创建更新标记文件失败: {e}")
+                # 即使创建失败也继续运行
+                return True
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                return False
+            # 写入PID和启动时间，便于排查
+            os.ftruncate(fd, 0)
+            os.write(fd, info.encode("utf-8"))
+            self._lock_fd = fd
+            logger.info(f"获取更新锁: {self.UPDATING_FILE}")
+            return True
+
+        if self.UPDATING_FILE.exists():
+            return False
+        try:
+            self.UPDATING_FILE.write_text(info)
+            logger.info(f"创建更新标记文件: {self.UPDATING_FILE}")
+        except Exception as e:
+            logger.error(f"创建更新标记文件失败: {e}")
+            # 即使创建失败也继续运行
+        return True
+
+    def _release_lock(self) -> None:
+        """释放单例锁"""
+        try:
+            if self._lock_fd is not None:
+                # 不删除文件：删除后其他进程可能锁住新建的同名文件，造成并发运行
+                os.ftruncate(self._lock_fd, 0)
+                os.close(self._lock_fd)
+                self._lock_fd = None
+                logger.info(f"释放更新锁: {self.UPDATING_FILE}")
+            elif not FCNTL_AVAILABLE and self.UPDATING_FILE.exists():
+                self.UPDATING_FILE.unlink()
+                logger.info(f"删除更新标记文件: {self.UPDATING_FILE}")
+        except Exception as e:
+            logger.error(f"释放更新锁失败: {e}")
+
     async def run_once(self):
         """运行一次检查流程"""
         # 检查是否有其他实例正在运行
-        if self.UPDATING_FILE.exists():
+        if not self._acquire_lock():
             logger.warning("检测到其他监控实例正在运行，本次运行取消")
             if self.console:
                 self.console.print("[yellow]⚠ 检测到其他监控实例正在运行，本次运行取消[/yellow]")
@@ -346,16 +560,7 @@ class SubscriptionMonitor:
                 print("⚠ 检测到其他监控实例正在运行，本次运行取消")
             return
 
-        # 创建更新标记文件
-        try:
-            import os
-            pid = os.getpid()
-            start_time = datetime.now().isoformat()
-            self.UPDATING_FILE.write_text(f"PID: {pid}\nStarted: {start_time}\n")
-            logger.info(f"创建更新标记文件: {self.UPDATING_FILE}")
-        except Exception as e:
-            logger.error(f"创建更新标记文件失败: {e}")
-            # 即使创建失败也继续运行
+        self._processed_snapshot = frozenset(self.processed_videos)
 
         try:
             # 1. 获取YouTuber列表
@@ -378,17 +583,10 @@ class SubscriptionMonitor:
             await self.process_queue(new_videos)
 
         except Exception as e:
-            logger.error(f"监控流程出错: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception(f"监控流程出错: {e}")
         finally:
-            # 无论成功还是失败，都删除更新标记文件
-            try:
-                if self.UPDATING_FILE.exists():
-                    self.UPDATING_FILE.unlink()
-                    logger.info(f"删除更新标记文件: {self.UPDATING_FILE}")
-            except Exception as e:
-                logger.error(f"删除更新标记文件失败: {e}")
+            # 无论成功还是失败，都释放锁
+            self._release_lock()
 
 
 def run(
@@ -1,5 +1,6 @@
 """配置管理模块"""
 
+import functools
 import os
 from pathlib import Path
 from typing import Optional
@@ -22,6 +23,8 @@ class Settings:
         self.max_video_size_mb: int = 500
         self.video_quality: str = "720p"
         self.youtube_cookies_file: Optional[str] = None  # YouTube cookies文件路径
+        self.download_concurrency: int = 8  # yt-dlp 并发下载/提取的最大线程数
+        self.ytdlp_concurrency: int = 4  # 搜索时同时进行的yt-dlp信息提取数（过高易触发YouTube限流）
 
         # 上传配置
         self.upload_cooldown_hours: int = 2
@@ -46,51 +49,64 @@ class Settings:
         self._load_env()
         self._ensure_directories()
 
+    # 环境变量名（小写）到属性名的映射
+    _ATTR_MAPPING = {
+        "youtube_api_key": "youtube_api_key",
+        "youtube_cookies_file": "youtube_cookies_file",
+        "bilibili_sessdata": "bilibili_sessdata",
+        "bilibili_bili_jct": "bilibili_bili_jct",
+        "bilibili_dedeuserid": "bilibili_dedeuser_id",
+        "download_path": "download_path",
+        "max_video_size_mb": "max_video_size_mb",
+        "video_quality": "video_quality",
+        "download_concurrency": "download_concurrency",
+        "ytdlp_concurrency": "ytdlp_concurrency",
+        "upload_cooldown_hours": "upload_cooldown_hours",
+        "auto_publish": "auto_publish",
+        "openai_api_key": "openai_api_key",
+        "openai_base_url": "openai_base_url",
+        "openai_model": "openai_model",
+        "log_level": "log_level",
+        "log_file": "log_file",
+        "ffmpeg_hwaccel": "ffmpeg_hwaccel",
+        "ffmpeg_preset": "ffmpeg_preset",
+        "proxy": "proxy",
+    }
+
     def _load_env(self) -> None:
         """加载环境变量"""
         env_file = ".env"
-        if os.path.exists(env_file):
-            with open(env_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip().lower()
-                        value = value.strip()
-
-                        # 映射环境变量到属性
-                        attr_mapping = {
-                            "youtube_api_key": "youtube_api_key",
-                            "youtube_cookies_file": "youtube_cookies_file",
-                            "bilibili_sessdata": "bilibili_sessdata",
-                            "bilibili_bili_jct": "bilibili_bili_jct",
-                            "bilibili_dedeuserid": "bilibili_dedeuser_id",
-                            "download_path": "download_path",
-                            "max_video_size_mb": "max_video_size_mb",
-                            "video_quality": "video_quality",
-                            "upload_cooldown_hours": "upload_cooldown_hours",
-                            "auto_publish": "auto_publish",
-                            "openai_api_key": "openai_api_key",
-                            "openai_base_url": "openai_base_url",
-                            "openai_model": "openai_model",
-                            "log_level": "log_level",
-                            "log_file": "log_file",
-                            "ffmpeg_hwaccel": "ffmpeg_hwaccel",
-                            "ffmpeg_preset": "ffmpeg_preset",
-                            "proxy": "proxy",
-                        }
-
-                        attr_name = attr_mapping.get(key)
-                        if attr_name:
-                            if key.endswith("_mb") or key.endswith("_hours"):
-                                try:
-                                    setattr(self, attr_name, int(value))
-                                except ValueError:
-                                    pass
-                            elif key == "auto_publish":
-                                setattr(self, attr_name, value.lower() in ("true", "1", "yes"))
-                            else:
-                                setattr(self, attr_name, value)
+        if not os.path.exists(env_file):
+            return
+
+        for line in Path(env_file).read_text(encoding="utf-8").splitlines():
+            line = line.strip()
+            if not line or line[0] == "#" or "=" not in line:
+                continue
+
+            key, _, value = line.partition("=")
+            key = key.strip().lower()
+
+            # 映射环境变量到属性
+            attr_name = self._ATTR_MAPPING.get(key)
+            if not attr_name:
+                continue
+
+            value = value.strip()
+            if key.endswith(("_mb", "_hours", "_concurrency")):
+                try:
+                    setattr(self, attr_name, int(value))
+                except ValueError:
+                    pass
+            elif key == "auto_publish":
+                setattr(self, attr_name, value.lower() in ("true", "1", "yes"))
+            else:
+                setattr(self, attr_name, value)
+
+    @functools.cached_property
+    def download_path_p(self) -> Path:
+        """下载目录的Path对象（进程生命周期内不变，只构造一次）"""
+        return Path(self.download_path)
 
     def _ensure_directories(self) -> None:
         """确保目录存在"""
@@ -50,11 +50,12 @@ def fixmain(srtpath,fps):
             break
         caps.append(Caption(capstr))
     ext=srtpath[srtpath.rfind("."):]
+    gap=int(round(1000.0/fps))
+    for i in range(0,len(caps)-1):
+        if caps[i].end>=caps[i+1].start:
+            caps[i].end=caps[i+1].start-gap
     fout=open(srtpath[:-len(ext)]+"_fix"+ext,"w",encoding="utf-8")
-    for i in range(0,len(caps)):
-        if i<len(caps)-1 and caps[i].end>=caps[i+1].start:
-            caps[i].end=caps[i+1].start-1000/fps
-        fout.write(caps[i].to_str())
+    fout.write("".join(cap.to_str() for cap in caps))
 
 if len(sys.argv)<2:
     print("Usage: fix_you_srt_tl.py <SRT file> [FPS(Default=60)]")
@@ -1,9 +1,12 @@
 """日志配置模块"""
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
-from pathlib import Path
-from typing import Optional
+from typing import IO, Any, Optional, Set
 
 try:
     from rich.console import Console
@@ -16,9 +19,55 @@ except ImportError:
 from .config import settings
 
 
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """队列满时丢弃日志记录的 QueueHandler，保证调用线程永不阻塞"""
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """带写缓冲、不逐条刷新的文件处理器，由 _BatchFlushQueueListener 批量刷新"""
+
+    BUFFER_SIZE = 64 * 1024
+
+    def _open(self) -> IO[str]:
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.BUFFER_SIZE,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchFlushQueueListener(logging.handlers.QueueListener):
+    """队列清空时（一批日志处理完毕）才刷新处理器的 QueueListener"""
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return super().dequeue(block)
+
+
 class Logger:
     """日志管理器"""
 
+    # 本进程中已创建过的日志目录，重复实例化时不再触发文件系统调用
+    _dirs_created: Set[str] = set()
+
     def __init__(self) -> None:
         if RICH_AVAILABLE:
             self.console = Console()
@@ -27,18 +76,28 @@ class Logger:
     def _setup_logger(self) -> None:
         """设置日志配置"""
         # 创建日志目录
-        log_path = Path(settings.log_file)
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log_dir = os.path.dirname(settings.log_file)
+        if log_dir and log_dir not in Logger._dirs_created:
+            os.makedirs(log_dir, exist_ok=True)
+            Logger._dirs_created.add(log_dir)
 
         # 配置处理器
         handlers = []
 
-        # 文件处理器
-        file_handler = logging.FileHandler(settings.log_file, encoding="utf-8")
+        # 文件处理器：由后台线程写入，日志调用方只需入队
+        file_handler = _BufferedFileHandler(settings.log_file, encoding="utf-8")
         file_handler.setFormatter(
             logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         )
-        handlers.append(file_handler)
+        log_queue: queue.Queue = queue.Queue(maxsize=10_000)
+        handlers.append(_DroppingQueueHandler(log_queue))
+        self._listener = _BatchFlushQueueListener(
+            log_queue, file_handler, respect_handler_level=True
+        )
+        self._listener.start()
+        # 退出时先排空队列，再刷新并关闭文件，避免丢失末尾日志
+        atexit.register(file_handler.close)
+        atexit.register(self._listener.stop)
 
         # 控制台处理器
         if RICH_AVAILABLE:
@@ -66,21 +125,29 @@ class Logger:
 
         self.logger = logging.getLogger("youtube_to_bilibili")
 
-    def info(self, message: str) -> None:
+    def is_debug(self) -> bool:
+        """DEBUG级别是否启用（用于在热循环中跳过调试信息的构造）"""
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """记录信息日志"""
-        self.logger.info(message)
+        self.logger.info(message, *args, **kwargs)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """记录错误日志"""
-        self.logger.error(message)
+        self.logger.error(message, *args, **kwargs)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """记录警告日志"""
-        self.logger.warning(message)
+        self.logger.warning(message, *args, **kwargs)
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """记录调试日志"""
-        self.logger.debug(message)
+        self.logger.debug(message, *args, **kwargs)
+
+    def exception(self, message: str, *args: Any, **kwargs: Any) -> None:
+        """记录错误日志并附带当前异常堆栈（仅在except块中调用）"""
+        self.logger.exception(message, *args, **kwargs)
 
 
 # 全局日志实例
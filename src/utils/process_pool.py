@@ -0,0 +1,36 @@
+"""进程池工具模块"""
+
+import atexit
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+
+def create_process_pool(
+    max_workers: int, initializer: Optional[Callable[[], None]] = None
+) -> ProcessPoolExecutor:
+    """创建进程池（进程退出时自动关闭）
+
+    主进程中已有日志、线程池等后台线程，fork多线程进程可能让子进程
+    死锁在fork时被其他线程持有的锁上，因此使用forkserver（不支持时用spawn）
+    启动工作进程。
+
+    Args:
+        max_workers: 最大工作进程数
+        initializer: 工作进程启动时调用的初始化函数（需为可pickle的模块级函数）
+
+    Returns:
+        进程池
+    """
+    start_method = (
+        "forkserver"
+        if "forkserver" in multiprocessing.get_all_start_methods()
+        else "spawn"
+    )
+    pool = ProcessPoolExecutor(
+        max_workers=max(1, max_workers),
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=initializer,
+    )
+    atexit.register(pool.shutdown)
+    return pool
@@ -1,9 +1,18 @@
 """YouTube视频下载模块"""
 
 import asyncio
+import functools
+import html
+import os
+import re
+import shutil
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 try:
     import yt_dlp
@@ -12,6 +21,13 @@ try:
 except ImportError:
     YT_DLP_AVAILABLE = False
 
+try:
+    import fcntl
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
 try:
     from PIL import Image
 
@@ -20,19 +36,163 @@ except ImportError:
     PILLOW_AVAILABLE = False
 
 from ..utils.config import settings
+from ..utils.process_pool import create_process_pool
 from ..utils.logger import logger
 from .models import YouTubeVideo
 
+# 文件名非法字符替换表
+_ILLEGAL_TRANS = str.maketrans({c: "_" for c in '<>:"/\\|?*'})
+
+# 视频信息缓存有效期（秒）：信息中的媒体直链会过期，超时后重新提取
+_INFO_CACHE_TTL = 300
+
+# 英文字幕语言代码优先级（需与 _check_subtitle_files 的语言标识对应）
+_SUB_LANG_PREFERENCE = ("en", "en-US")
+
+
+@functools.lru_cache(maxsize=2048)
+def _sanitize_filename(filename: str) -> str:
+    """清理文件名，移除非法字符（同一标题在下载流程中会被多次清理，结果按标题缓存）"""
+    # 替换非法字符、限制长度、移除首尾空格和点
+    return filename.translate(_ILLEGAL_TRANS)[:100].strip(". ") or "untitled"
+
+
+# WebVTT 时间戳（小时可省略）与行内标签，如 <00:00:01.500><c> word</c>
+_VTT_TIME_RE = re.compile(r"(?:(\d+):)?(\d{2}):(\d{2})\.(\d{3})")
+_VTT_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def _vtt_time_to_srt(timestamp: str) -> str:
+    """WebVTT时间戳转SRT格式：[HH:]MM:SS.mmm -> HH:MM:SS,mmm"""
+    match = _VTT_TIME_RE.match(timestamp)
+    if not match:
+        raise ValueError(f"无效的VTT时间戳: {timestamp}")
+    hours, minutes, seconds, millis = match.groups()
+    return f"{int(hours or 0):02d}:{minutes}:{seconds},{millis}"
+
+
+def _vtt_to_srt(src: str, dst: str) -> int:
+    """将WebVTT字幕流式转换为SRT，返回写出的字幕条数
+
+    只处理包含 "-->" 的时间轴行及其后的文本行，文件头、NOTE、STYLE 块和cue标识自然被跳过；
+    去掉时间轴上的cue设置和文本中的行内标签，空字幕不输出。
+    """
+    index = 0
+    with open(src, encoding="utf-8-sig") as fin, open(
+        dst, "w", encoding="utf-8"
+    ) as fout:
+        lines = iter(fin)
+        for line in lines:
+            if "-->" not in line:
+                continue
+            start, _, rest = line.partition("-->")
+            end = rest.split()[0]
+
+            texts = []
+            for text in lines:
+                text = text.strip()
+                if not text:
+                    break
+                text = html.unescape(_VTT_TAG_RE.sub("", text)).strip()
+                if text:
+                    texts.append(text)
+            if not texts:
+                continue
+
+            index += 1
+            fout.write(
+                f"{index}\n{_vtt_time_to_srt(start.strip())} --> "
+                f"{_vtt_time_to_srt(end)}\n" + "\n".join(texts) + "\n\n"
+            )
+    return index
+
+
+# Linux FICLONE ioctl：在 btrfs/XFS 等文件系统上做写时复制克隆，不复制数据块
+_FICLONE = 0x40049409
+
+
+def _clone_file(src: Path, dst: Path) -> None:
+    """复制文件，优先使用写时复制克隆，不支持时退回普通复制
+
+    不使用硬链接/软链接：后续 ffmpeg 以 -y 覆盖 {title}.mp4 时会截断共享的inode，
+    连带毁掉作为输入的原始视频。
+    """
+    if FCNTL_AVAILABLE:
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            shutil.copystat(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.copy(str(src), str(dst))
+
+
+def _convert_to_cover_jpg(src: str, dst: str) -> None:
+    """将封面图转换为JPG（在进程池中执行，需为可pickle的模块级函数）"""
+    with Image.open(src) as img:
+        # 转换为RGB模式（如果是RGBA、P等模式）
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        # 保存为JPG格式（封面图quality=90已足够，体积明显更小）
+        img.save(dst, "JPEG", quality=90)
+
+
+# 封面图转换进程池（图片编解码是CPU密集型，放到子进程中不受GIL限制），首次使用时创建
+_thumb_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_thumb_pool() -> ProcessPoolExecutor:
+    """获取封面图转换进程池"""
+    global _thumb_pool
+    if _thumb_pool is None:
+        _thumb_pool = create_process_pool(min(4, os.cpu_count() or 1))
+    return _thumb_pool
+
+
+def _close_ydls(ydl_instances: List["yt_dlp.YoutubeDL"]) -> None:
+    """关闭YoutubeDL实例（会写回cookies文件）并清空列表"""
+    for ydl in ydl_instances:
+        try:
+            ydl.close()
+        except Exception:
+            pass
+    ydl_instances.clear()
+
 
 class YouTubeDownloader:
     """YouTube视频下载器"""
 
+    # 所有实例共享的yt-dlp线程池（yt-dlp以网络I/O为主，读socket时释放GIL）
+    _executor = ThreadPoolExecutor(
+        max_workers=max(1, settings.download_concurrency),
+        thread_name_prefix="yt-dlp",
+    )
+    # 元数据探测单独使用一个线程池，避免被长时间运行的下载占满而排队
+    _meta_executor = ThreadPoolExecutor(
+        max_workers=max(1, settings.download_concurrency),
+        thread_name_prefix="yt-dlp-meta",
+    )
+
+    # 本进程中已创建过的下载目录，重复实例化时不再触发文件系统调用
+    _dirs_created: Set[Path] = set()
+
     def __init__(self) -> None:
-        self.download_path = Path(settings.download_path)
-        self.download_path.mkdir(parents=True, exist_ok=True)
+        self.download_path = settings.download_path_p
+        if self.download_path not in YouTubeDownloader._dirs_created:
+            os.makedirs(self.download_path, exist_ok=True)
+            YouTubeDownloader._dirs_created.add(self.download_path)
         self.max_size_mb = settings.max_video_size_mb
         self.quality = settings.video_quality
+        self._format_selector = self._build_format_selector(self.quality)
         self.cookies_file = settings.youtube_cookies_file
+        # get_video_info 提取到的视频信息 {video_id: info}，下载时复用以免重复请求
+        self._info_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # 每个线程池线程各持有一个元数据用YoutubeDL，复用其HTTP连接
+        self._local = threading.local()
+        self._ydl_instances: List["yt_dlp.YoutubeDL"] = []
+        # 实例被回收或进程退出时关闭；finalize 只引用列表，不会让实例一直存活
+        weakref.finalize(self, _close_ydls, self._ydl_instances)
 
         if not YT_DLP_AVAILABLE:
             logger.warning("yt-dlp模块不可用，将使用模拟下载")
@@ -47,49 +207,90 @@ class YouTubeDownloader:
 
         return await self._download_with_ytdlp(video, progress_callback)
 
+    async def download_many(
+        self,
+        videos: List[YouTubeVideo],
+        progress_callback: Optional[Callable] = None,
+        concurrency: Optional[int] = None,
+    ) -> List[Optional[Path]]:
+        """并发下载多个视频
+
+        元数据探测与下载流水线化：视频拿到元数据后立即进入下载阶段，
+        同时后续视频的元数据探测继续进行。下载并发数默认由
+        settings.download_concurrency 限制，流水线中最多同时有两倍于该值的视频，
+        返回结果与输入顺序一致。
+
+        Args:
+            videos: 要下载的视频列表
+            progress_callback: 进度回调 callback(video, percent, speed)
+            concurrency: 下载并发数，默认使用 settings.download_concurrency
+        """
+        concurrency = max(1, concurrency or settings.download_concurrency)
+        pipeline_semaphore = asyncio.Semaphore(concurrency * 2)
+        download_semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_running_loop()
+
+        async def _pipeline(video: YouTubeVideo) -> Optional[Path]:
+            async with pipeline_semaphore:
+                # 元数据阶段：预取视频信息，下载时由 _check_subtitles 直接复用
+                if self._peek_info(video.video_id) is None:
+                    info = await loop.run_in_executor(
+                        self._meta_executor, self._extract_info_sync, video.url
+                    )
+                    if info:
+                        self._cache_info(video.video_id, info)
+
+                # 下载阶段
+                async with download_semaphore:
+                    callback = (
+                        functools.partial(progress_callback, video)
+                        if progress_callback
+                        else None
+                    )
+                    return await self.download_video(video, callback)
+
+        return list(await asyncio.gather(*(_pipeline(v) for v in videos)))
+
     async def _download_with_ytdlp(
         self, video: YouTubeVideo, progress_callback: Optional[Callable] = None
     ) -> Optional[Path]:
         """使用yt-dlp下载视频"""
         try:
-            logger.info(f"开始下载视频: {video.title}")
+            logger.info("开始下载视频: %s", video.title)
 
             # 创建视频专属文件夹
             video_folder = self.download_path / video.folder_name
             video_folder.mkdir(parents=True, exist_ok=True)
-            logger.info(f"创建视频文件夹: {video_folder.name}")
+            logger.info("创建视频文件夹: %s", video_folder.name)
 
             # 检查视频是否已存在（检查 _original.mp4 和最终嵌入的 .mp4）
             safe_title = self._sanitize_filename(video.title)
             original_video = video_folder / f"{safe_title}_original.mp4"
             final_video = video_folder / f"{safe_title}.mp4"
 
-            if original_video.exists():
-                logger.info(f"视频已存在，跳过下载: {original_video.name}")
+            # 一次列出目录，两个文件名只做集合成员判断
+            existing_names = set(os.listdir(video_folder))
+            if original_video.name in existing_names:
+                logger.info("视频已存在，跳过下载: %s", original_video.name)
                 return original_video
-            if final_video.exists():
-                logger.info(f"视频已存在（最终版本），跳过下载: {final_video.name}")
-                # 如果最终版本存在，需要检查是否有 _original，如果没有则重命名
-                if not original_video.exists():
-                    import shutil
-
-                    shutil.copy(str(final_video), str(original_video))
-                    logger.info(f"从最终视频创建原始副本: {original_video.name}")
+            if final_video.name in existing_names:
+                logger.info("视频已存在（最终版本），跳过下载: %s", final_video.name)
+                # 最终版本存在但没有 _original（上面已判断），复制一份原始副本
+                _clone_file(final_video, original_video)
+                logger.info("从最终视频创建原始副本: %s", original_video.name)
                 return original_video
 
             # 构建输出文件名（保存到视频专属文件夹）
             # 注意：视频文件下载后会重命名为 {title}_original.mp4
             output_template = str(video_folder / f"{safe_title}.%(ext)s")
 
-            # 首先检查是否有字幕
-            has_subs = await self._check_subtitles(video.url)
-            if not has_subs:
-                logger.info(f"该视频没有字幕: {video.title}")
+            # 首先检查是否有字幕（同时取得视频信息，供下载时复用）
+            info = await self._check_subtitles(video)
 
             # 配置yt-dlp选项
             ydl_opts = {
                 "outtmpl": output_template,
-                "format": self._get_format_selector(),  # 使用配置的分辨率
+                "format": self._format_selector,  # 使用配置的分辨率
                 "ignoreerrors": True,
                 "no_warnings": True,
                 # 合并选项（用于1080p等需要合并视频和音频的情况）
@@ -105,91 +306,130 @@ class YouTubeDownloader:
                 "keepvideo": False,  # 不保留中间文件
             }
 
+            # 已知可用字幕时只请求确定存在的那一种语言；没有英文字幕则不再请求字幕
+            if info:
+                sub_lang = self._pick_subtitle_lang(info)
+                if sub_lang:
+                    ydl_opts["subtitleslangs"] = [sub_lang]
+                else:
+                    ydl_opts["writesubtitles"] = False
+                    ydl_opts["writeautomaticsub"] = False
+
             # 如果配置了cookies文件，添加cookies支持
             if self.cookies_file and Path(self.cookies_file).exists():
                 ydl_opts["cookiefile"] = self.cookies_file
-                logger.info(f"使用cookies文件: {self.cookies_file}")
+                logger.info("使用cookies文件: %s", self.cookies_file)
 
             # 如果配置了代理，添加代理支持
             if settings.proxy:
                 ydl_opts["proxy"] = settings.proxy
-                logger.info(f"使用代理: {settings.proxy}")
+                logger.info("使用代理: %s", settings.proxy)
 
-            # 添加进度回调
+            loop = asyncio.get_running_loop()
+
+            # 添加进度回调：下载线程只投递进度事件，回调在事件循环中执行
+            drain_task = None
             if progress_callback:
+                progress_queue: asyncio.Queue = asyncio.Queue(maxsize=64)
                 ydl_opts["progress_hooks"] = [
-                    self._create_progress_hook(progress_callback)
+                    self._create_progress_hook(loop, progress_queue)
                 ]
+                drain_task = asyncio.create_task(
+                    self._drain_progress(progress_queue, progress_callback)
+                )
 
             # 在线程池中执行下载
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                None, self._download_sync, video.url, ydl_opts
-            )
+            try:
+                result = await loop.run_in_executor(
+                    self._executor, self._download_sync, video.url, ydl_opts, info
+                )
+            finally:
+                if drain_task:
+                    await progress_queue.put(None)
+                    await drain_task
 
             if result:
-                logger.info(f"下载完成: {result}")
+                logger.info("下载完成: %s", result)
+                # 列出一次视频文件夹，字幕和封面图检查共用
+                file_names = self._list_files(result.parent)
                 # 检查字幕文件是否下载成功
-                await self._check_subtitle_files(result)
+                await self._check_subtitle_files(result, file_names)
                 # 检查封面图是否下载成功
-                await self._check_thumbnail_files(result)
+                await self._check_thumbnail_files(result, file_names)
 
                 # 重命名原始视频为 {title}_original.mp4，并获取新的路径
                 renamed_path = await self._rename_original_video(result)
                 return renamed_path if renamed_path else result
             else:
-                logger.error(f"下载失败: {video.title}")
+                logger.error("下载失败: %s", video.title)
                 return None
 
         except Exception as e:
-            logger.error(f"下载视频失败: {video.title}, 错误: {str(e)}")
+            logger.error("下载视频失败: %s, 错误: %s", video.title, e)
             return None
 
-    async def _check_subtitles(self, url: str) -> bool:
-        """检查视频是否有字幕"""
-        try:
+    async def _check_subtitles(self, video: YouTubeVideo) -> Optional[Dict[str, Any]]:
+        """检查视频是否有字幕
 
-            ydl_opts = {
-                "quiet": True,
-                "no_warnings": True,
-                "skip_download": True,  # 不下载视频
-            }
-
-            # 如果配置了代理，添加代理支持
-            if settings.proxy:
-                ydl_opts["proxy"] = settings.proxy
-
-            loop = asyncio.get_event_loop()
-            info = await loop.run_in_executor(
-                None,
-                self._extract_info_sync,
-                url,
-                ydl_opts,
-            )
+        Returns:
+            提取到的视频信息（供下载时复用，避免再次请求），提取失败返回None
+        """
+        try:
+            info = self._pop_info(video.video_id)
+            if info is None:
+                loop = asyncio.get_running_loop()
+                info = await loop.run_in_executor(
+                    self._meta_executor,
+                    self._extract_info_sync,
+                    video.url,
+                )
 
             if not info:
-                return False
+                return None
 
             # 检查是否有字幕
-            subtitles = info.get("subtitles", {})
-            automatic_captions = info.get("automatic_captions", {})
+            subtitles = info.get("subtitles") or {}
+            automatic_captions = info.get("automatic_captions") or {}
 
-            has_subs = bool(subtitles or automatic_captions)
-
-            if has_subs:
+            if subtitles or automatic_captions:
                 available_langs = list(subtitles.keys()) + list(
                     automatic_captions.keys()
                 )
-                logger.info(f"视频有可用字幕: {', '.join(set(available_langs))}")
+                logger.info("视频有可用字幕: %s", ", ".join(set(available_langs)))
+            else:
+                logger.info("该视频没有字幕: %s", video.title)
 
-            return has_subs
+            return info
 
         except Exception as e:
-            logger.debug(f"检查字幕失败: {str(e)}")
-            return False
+            logger.debug("检查字幕失败: %s", e)
+            return None
+
+    @staticmethod
+    def _pick_subtitle_lang(info: Dict[str, Any]) -> Optional[str]:
+        """从视频信息中选出要下载的英文字幕语言，人工字幕优先于自动字幕"""
+        for captions in (info.get("subtitles"), info.get("automatic_captions")):
+            if captions:
+                for lang in _SUB_LANG_PREFERENCE:
+                    if lang in captions:
+                        return lang
+        return None
 
-    async def _check_subtitle_files(self, video_path: Path) -> None:
-        """检查字幕文件并重命名为标准格式"""
+    @staticmethod
+    def _list_files(folder: Path) -> List[str]:
+        """列出文件夹中的普通文件名（单次目录扫描）"""
+        with os.scandir(folder) as it:
+            return [entry.name for entry in it if entry.is_file()]
+
+    async def _check_subtitle_files(
+        self, video_path: Path, file_names: Optional[List[str]] = None
+    ) -> None:
+        """检查字幕文件并重命名为标准格式
+
+        Args:
+            video_path: 视频文件路径
+            file_names: 视频文件夹中的文件名列表，未提供时自行扫描
+        """
         try:
             parent_dir = video_path.parent
             base_name = video_path.stem  # 原始视频标题
@@ -200,14 +440,19 @@ class YouTubeDownloader:
 
             found_en_sub = None
 
+            # 目录只列一次，之后只做集合成员判断
+            if file_names is None:
+                file_names = self._list_files(parent_dir)
+            names = set(file_names)
+
             # 查找英文字幕
             for ext in sub_extensions:
                 for lang in lang_patterns:
                     # 检查 {标题}{语言标识}.{扩展名}
-                    sub_file = parent_dir / f"{base_name}{lang}{ext}"
-                    if sub_file.exists():
-                        found_en_sub = sub_file
-                        logger.info(f"找到英文字幕: {sub_file.name}")
+                    sub_name = f"{base_name}{lang}{ext}"
+                    if sub_name in names:
+                        found_en_sub = parent_dir / sub_name
+                        logger.info("找到英文字幕: %s", sub_name)
                         break
                 if found_en_sub:
                     break
@@ -215,106 +460,121 @@ class YouTubeDownloader:
             # 重命名英文字幕为 en.srt
             if found_en_sub:
                 target_en = parent_dir / "en.srt"
-                if found_en_sub != target_en:
-                    # 如果是VTT格式，转换为SRT
-                    if found_en_sub.suffix.lower() == ".vtt":
-                        # 这里可以添加VTT转SRT的逻辑，暂时直接重命名
-                        logger.warning(
-                            f"字幕为VTT格式，将重命名为.srt: {found_en_sub.name}"
-                        )
+                if found_en_sub.suffix.lower() == ".vtt":
+                    # VTT格式，转换为SRT（在线程中执行，避免阻塞事件循环）
+                    logger.info("字幕为VTT格式，转换为SRT: %s", found_en_sub.name)
+                    count = await asyncio.to_thread(
+                        _vtt_to_srt, str(found_en_sub), str(target_en)
+                    )
+                    found_en_sub.unlink()
+                    logger.info("英文字幕已转换为: en.srt (%s条)", count)
+                elif found_en_sub != target_en:
                     found_en_sub.rename(target_en)
                     logger.info("英文字幕已重命名为: en.srt")
             else:
                 logger.info("未找到英文字幕文件")
 
         except Exception as e:
-            logger.debug(f"检查字幕文件失败: {str(e)}")
+            logger.debug("检查字幕文件失败: %s", e)
+
+    async def _check_thumbnail_files(
+        self, video_path: Path, file_names: Optional[List[str]] = None
+    ) -> None:
+        """检查封面图文件并统一转换为JPG格式，命名为 cover.jpg
 
-    async def _check_thumbnail_files(self, video_path: Path) -> None:
-        """检查封面图文件并统一转换为JPG格式，命名为 cover.jpg"""
+        Args:
+            video_path: 视频文件路径
+            file_names: 视频文件夹中的文件名列表，未提供时自行扫描
+        """
         try:
             parent_dir = video_path.parent
             base_name = video_path.stem  # 原始视频标题
 
             # 封面图可能的扩展名
-            thumbnail_extensions = [".jpg", ".jpeg", ".png", ".webp"]
+            thumbnail_extensions = (".jpg", ".jpeg", ".png", ".webp")
+
+            # 单次扫描目录：与视频同名的封面图优先，其余按扩展名归类（不含隐藏文件）
+            same_name: Dict[str, str] = {}
+            others: Dict[str, List[str]] = {ext: [] for ext in thumbnail_extensions}
+            if file_names is None:
+                file_names = self._list_files(parent_dir)
+            for name in file_names:
+                stem, dot, ext = name.rpartition(".")
+                ext = dot + ext.lower()
+                if ext not in others or name.startswith("."):
+                    continue
+                if stem == base_name:
+                    same_name[ext] = name
+                else:
+                    others[ext].append(name)
 
             found_thumbnails = []
-
-            # 检查与视频同名的封面图文件
             for ext in thumbnail_extensions:
-                thumbnail_file = parent_dir / f"{base_name}{ext}"
-                if thumbnail_file.exists():
-                    found_thumbnails.append(thumbnail_file)
-                    logger.info(f"封面图已下载: {thumbnail_file.name}")
-
-            # 检查 yt-dlp 可能生成的其他命名格式
+                if ext in same_name:
+                    found_thumbnails.append(parent_dir / same_name[ext])
+                    logger.info("封面图已下载: %s", same_name[ext])
+            # yt-dlp 可能生成的其他命名格式（同扩展名的任意文件）
             for ext in thumbnail_extensions:
-                # 尝试查找 "封面图" 或 "thumbnail" 相关文件
-                for pattern in [f"*{ext}", f"thumbnail*{ext}", f"*_thumbnail{ext}"]:
-                    matches = list(parent_dir.glob(pattern))
-                    for match in matches:
-                        if match.is_file() and match not in found_thumbnails:
-                            found_thumbnails.append(match)
-                            logger.info(f"找到封面图: {match.name}")
+                for name in others[ext]:
+                    found_thumbnails.append(parent_dir / name)
+                    logger.info("找到封面图: %s", name)
 
             if found_thumbnails:
                 # 统一转换为 cover.jpg
                 cover_jpg = parent_dir / "cover.jpg"
 
                 for thumb in found_thumbnails:
-                    if (
-                        thumb.suffix.lower() in [".jpg", ".jpeg"]
-                        and thumb.name != "cover.jpg"
-                    ):
-                        # 已是JPG格式，直接重命名
-                        thumb.rename(cover_jpg)
-                        logger.info("封面图已重命名为: cover.jpg")
+                    if thumb.suffix.lower() in (".jpg", ".jpeg"):
+                        # 已是JPG格式，无需解码，直接重命名（已是 cover.jpg 则保持不动）
+                        if thumb != cover_jpg:
+                            thumb.rename(cover_jpg)
+                            logger.info("封面图已重命名为: cover.jpg")
                         # 删除其他封面图
                         for other_thumb in found_thumbnails:
-                            if other_thumb != thumb and other_thumb.exists():
+                            if other_thumb != thumb and other_thumb != cover_jpg:
                                 try:
-                                    other_thumb.unlink()
-                                    logger.debug(f"删除重复封面图: {other_thumb.name}")
+                                    other_thumb.unlink(missing_ok=True)
+                                    logger.debug("删除重复封面图: %s", other_thumb.name)
                                 except Exception as e:
                                     logger.debug(
-                                        f"删除封面图失败: {other_thumb.name}, {str(e)}"
+                                        "删除封面图失败: %s, %s", other_thumb.name, e
                                     )
                         break
                     else:
                         # 非JPG格式，转换并保存为 cover.jpg
                         if PILLOW_AVAILABLE:
                             try:
-                                with Image.open(thumb) as img:
-                                    # 转换为RGB模式（如果是RGBA等模式）
-                                    if img.mode in ("RGBA", "P"):
-                                        img = img.convert("RGB")
-                                    # 保存为JPG格式
-                                    img.save(cover_jpg, "JPEG", quality=95)
+                                loop = asyncio.get_running_loop()
+                                await loop.run_in_executor(
+                                    _get_thumb_pool(),
+                                    _convert_to_cover_jpg,
+                                    str(thumb),
+                                    str(cover_jpg),
+                                )
                                 logger.info("封面图已转换为: cover.jpg")
                                 # 删除原文件
                                 try:
                                     thumb.unlink()
-                                    logger.debug(f"删除原封面图: {thumb.name}")
+                                    logger.debug("删除原封面图: %s", thumb.name)
                                 except Exception as e:
                                     logger.debug(
-                                        f"删除原封面图失败: {thumb.name}, {str(e)}"
+                                        "删除原封面图失败: %s, %s", thumb.name, e
                                     )
                                 # 删除其他封面图
                                 for other_thumb in found_thumbnails:
-                                    if other_thumb != thumb and other_thumb.exists():
+                                    if other_thumb != thumb and other_thumb != cover_jpg:
                                         try:
-                                            other_thumb.unlink()
+                                            other_thumb.unlink(missing_ok=True)
                                             logger.debug(
-                                                f"删除其他封面图: {other_thumb.name}"
+                                                "删除其他封面图: %s", other_thumb.name
                                             )
                                         except Exception as e:
                                             logger.debug(
-                                                f"删除封面图失败: {other_thumb.name}, {str(e)}"
+                                                "删除封面图失败: %s, %s", other_thumb.name, e
                                             )
                                 break
                             except Exception as e:
-                                logger.error(f"转换封面图失败: {thumb.name}, {str(e)}")
+                                logger.error("转换封面图失败: %s, %s", thumb.name, e)
                         else:
                             logger.warning("Pillow未安装，无法转换封面图为JPG格式")
 
@@ -323,7 +583,7 @@ class YouTubeDownloader:
                 logger.info("未找到封面图文件")
 
         except Exception as e:
-            logger.debug(f"检查封面图文件失败: {str(e)}")
+            logger.debug("检查封面图文件失败: %s", e)
 
     async def _rename_original_video(self, video_path: Path) -> Optional[Path]:
         """将原始视频重命名为 {title}_original.mp4，并返回新路径
@@ -334,58 +594,81 @@ class YouTubeDownloader:
         Returns:
             重命名后的视频文件路径，如果文件已经是_original结尾或重命名失败则返回原路径
         """
-        try:
-            parent_dir = video_path.parent
-            base_name = video_path.stem  # 原始视频标题
+        # 文件已经是_original结尾（断点续跑时的常见情况），纯字符串判断，直接返回原路径
+        if video_path.name.endswith("_original.mp4"):
+            return video_path
 
+        try:
             # 目标文件名：{title}_original.mp4
-            original_name = f"{base_name}_original.mp4"
-            original_path = parent_dir / original_name
-
-            # 如果文件不叫 _original，则重命名
-            if not video_path.name.endswith("_original.mp4"):
-                if original_path.exists():
-                    # 如果目标文件已存在，删除它
-                    original_path.unlink()
-                    logger.debug(f"删除已存在的原始视频文件: {original_name}")
+            original_name = f"{video_path.stem}_original.mp4"
+            original_path = video_path.parent / original_name
 
-                video_path.rename(original_path)
-                logger.info(f"原始视频已重命名为: {original_name}")
-                return original_path
-
-            # 文件已经是_original结尾，直接返回原路径
-            return video_path
+            # os.replace 会原子地覆盖已存在的目标文件，无需先 exists + unlink
+            os.replace(video_path, original_path)
+            logger.info("原始视频已重命名为: %s", original_name)
+            return original_path
 
         except Exception as e:
-            logger.error(f"重命名原始视频失败: {str(e)}")
+            logger.error("重命名原始视频失败: %s", e)
             return None
 
-    def _download_sync(self, url: str, ydl_opts: Dict[str, Any]) -> Optional[Path]:
-        """同步下载方法"""
+    def _download_sync(
+        self,
+        url: str,
+        ydl_opts: Dict[str, Any],
+        info: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Path]:
+        """同步下载方法
+
+        Args:
+            url: 视频链接
+            ydl_opts: yt-dlp选项
+            info: 已提取的视频信息，提供时跳过重复的 extract_info 请求
+        """
         try:
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 # 获取视频信息
-                info = ydl.extract_info(url, download=False)
+                if info is None:
+                    info = ydl.extract_info(url, download=False)
 
                 # 检查文件大小
                 if self._check_file_size(info):
-                    # 下载视频
-                    ydl.download([url])
-
-                    # 查找下载的文件
-                    return self._find_downloaded_file(info, ydl_opts["outtmpl"])
+                    # 直接用已提取的信息下载（download([url]) 会再请求一次元数据），
+                    # 与 yt-dlp 的 --load-info-json 相同。复用期间关闭 ignoreerrors，
+                    # 否则失败只会被记录而不抛出，无法触发下面的重新提取
+                    ydl.params["ignoreerrors"] = False
+                    try:
+                        ydl.process_ie_result(ydl.sanitize_info(info), download=True)
+                    except (
+                        yt_dlp.utils.DownloadError,
+                        yt_dlp.utils.EntryNotInPlaylist,
+                        yt_dlp.utils.ReExtractInfo,
+                    ) as e:
+                        logger.warning("复用视频信息下载失败，重新提取: %s", e)
+                    finally:
+                        ydl.params["ignoreerrors"] = ydl_opts.get("ignoreerrors", False)
+
+                    # 查找下载的文件；复用信息未产出文件时退回按URL重新下载
+                    downloaded = self._find_downloaded_file(info, ydl_opts["outtmpl"])
+                    if downloaded is None:
+                        ydl.download([url])
+                        downloaded = self._find_downloaded_file(
+                            info, ydl_opts["outtmpl"]
+                        )
+                    return downloaded
                 else:
                     logger.warning(
-                        f"视频文件过大，跳过下载: {info.get('title', 'Unknown')}"
+                        "视频文件过大，跳过下载: %s", info.get("title", "Unknown")
                     )
                     return None
 
         except Exception as e:
-            logger.error(f"yt-dlp下载失败: {str(e)}")
+            logger.error("yt-dlp下载失败: %s", e)
             return None
 
-    def _get_format_selector(self) -> str:
-        """获取格式选择器
+    @staticmethod
+    def _build_format_selector(quality: str) -> str:
+        """构建格式选择器
 
         YouTube的高分辨率视频（1080p+）通常是分离的视频和音频流（DASH格式），
         需要合并。这个格式选择器会优先选择单文件，然后回退到视频+音频合并。
@@ -396,7 +679,7 @@ class YouTubeDownloader:
             "1080p": "1080",
         }
 
-        height = quality_map.get(self.quality, "720")
+        height = quality_map.get(quality, "720")
 
         # 格式选择逻辑：
         # 1. 优先选择单文件mp4（video+audio在一起）
@@ -429,21 +712,12 @@ class YouTubeDownloader:
 
             if isinstance(template, dict):
                 # 如果是字典格式，尝试从 'default' 键获取模板
-                default_template = template.get("default", "")
-                if default_template:
-                    # 提取文件夹路径
-                    import re
-
-                    match = re.match(r"^(.+[\\/])[^\\/]*\.\%\(", default_template)
-                    if match:
-                        video_folder = Path(match.group(1))
-            elif isinstance(template, str):
-                # 如果是字符串格式
-                import re
-
-                match = re.match(r"^(.+[\\/])[^\\/]*\.\%\(", template)
-                if match:
-                    video_folder = Path(match.group(1))
+                template = template.get("default", "")
+            if isinstance(template, str) and template:
+                # 模板形如 "/path/to/folder/title.%(ext)s"，父目录即视频文件夹
+                folder = os.path.dirname(template)
+                if folder:
+                    video_folder = Path(folder)
 
             # 如果无法从 template 提取，从 info 中构建文件夹路径
             if video_folder is None:
@@ -453,77 +727,101 @@ class YouTubeDownloader:
                 )
                 video_folder = self.download_path / f"{channel_title}|{video_id}"
 
-            if not video_folder.exists():
-                logger.error(f"视频文件夹不存在: {video_folder}")
-                return None
-
             # 尝试根据标题构建文件名
             title = self._sanitize_filename(info.get("title", ""))
 
-            # 可能的扩展名
-            extensions = ["mp4", "webm", "mkv", "avi"]
+            # 可能的扩展名（按优先级排列）
+            extensions = ("mp4", "webm", "mkv", "avi")
+
+            # 单次扫描视频文件夹，按扩展名收集候选文件（文件夹不存在时由scandir报错）
+            candidates: Dict[str, List[os.DirEntry]] = {ext: [] for ext in extensions}
+            try:
+                with os.scandir(video_folder) as it:
+                    for entry in it:
+                        stem, _, ext = entry.name.rpartition(".")
+                        if ext in candidates and stem:
+                            candidates[ext].append(entry)
+            except FileNotFoundError:
+                logger.error("视频文件夹不存在: %s", video_folder)
+                return None
 
-            # 首先尝试完全匹配
+            # 首先尝试完全匹配（只比较文件名字符串，命中后才构造Path）
             for ext in extensions:
-                filename = f"{title}.{ext}"
-                filepath = video_folder / filename
-                if filepath.exists():
-                    logger.info(f"找到视频文件: {filepath.name}")
-                    return filepath
+                exact_name = f"{title}.{ext}"
+                for entry in candidates[ext]:
+                    if entry.name == exact_name:
+                        logger.info("找到视频文件: %s", exact_name)
+                        return Path(entry.path)
 
-            # 如果找不到，搜索视频文件夹中所有视频文件，返回最新的
+            # 如果找不到，返回视频文件夹中最新的视频文件
             for ext in extensions:
-                matches = list(video_folder.glob(f"*.{ext}"))
-                if matches:
-                    # 返回最新的文件
-                    latest = max(matches, key=lambda p: p.stat().st_mtime)
-                    logger.info(f"找到最新视频文件: {latest.name}")
-                    return latest
-
-            logger.error(f"在 {video_folder} 中未找到视频文件")
+                if candidates[ext]:
+                    latest = max(candidates[ext], key=lambda e: e.stat().st_mtime)
+                    logger.info("找到最新视频文件: %s", latest.name)
+                    return Path(latest.path)
+
+            logger.error("在 %s 中未找到视频文件", video_folder)
             return None
 
         except Exception as e:
-            logger.error(f"查找下载文件失败: {str(e)}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.exception("查找下载文件失败: %s", e)
             return None
 
-    def _create_progress_hook(self, callback: Callable) -> Callable:
-        """创建进度回调钩子"""
+    def _create_progress_hook(
+        self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue
+    ) -> Callable:
+        """创建进度回调钩子（在yt-dlp下载线程中调用）"""
+
+        def offer(item) -> None:
+            # 队列满说明界面跟不上，丢弃最旧的进度，保证最新进度（含完成事件）不丢
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(item)
+
+        # 只在整数百分比变化时投递，避免每个下载分块都跨线程通知
+        last_percent = -1
 
         def progress_hook(d):
-            if d["status"] == "downloading":
-                if "total_bytes" in d:
-                    percent = d["downloaded_bytes"] / d["total_bytes"] * 100
-                    callback(percent, d.get("speed", 0))
+            nonlocal last_percent
+            status = d["status"]
+            if status == "downloading":
+                total = d.get("total_bytes")
+                if total:
+                    percent = d["downloaded_bytes"] * 100 // total
                 elif "_percent_str" in d:
                     try:
-                        percent = float(d["_percent_str"].replace("%", ""))
-                        callback(percent, d.get("speed", 0))
-                    except:
-                        pass
-            elif d["status"] == "finished":
-                callback(100, 0)
+                        percent = int(float(d["_percent_str"].replace("%", "")))
+                    except ValueError:
+                        return
+                else:
+                    return
+                if percent != last_percent:
+                    last_percent = percent
+                    loop.call_soon_threadsafe(offer, (percent, d.get("speed", 0)))
+            elif status == "finished":
+                loop.call_soon_threadsafe(offer, (100, 0))
 
         return progress_hook
 
+    async def _drain_progress(self, queue: asyncio.Queue, callback: Callable) -> None:
+        """在事件循环中消费进度事件并调用回调，相同进度只回调一次；收到None结束"""
+        last_percent = None
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            percent, speed = item
+            if percent == last_percent:
+                continue
+            last_percent = percent
+            try:
+                callback(percent, speed)
+            except Exception as e:
+                logger.debug("进度回调失败: %s", e)
+
     def _sanitize_filename(self, filename: str) -> str:
         """清理文件名，移除非法字符"""
-        # 移除或替换非法字符
-        illegal_chars = '<>:"/\\|?*'
-        for char in illegal_chars:
-            filename = filename.replace(char, "_")
-
-        # 限制长度
-        if len(filename) > 100:
-            filename = filename[:100]
-
-        # 移除首尾空格和点
-        filename = filename.strip(". ")
-
-        return filename or "untitled"
+        return _sanitize_filename(filename)
 
     async def get_video_info(self, url: str) -> Optional[YouTubeVideo]:
         """获取视频信息"""
@@ -532,65 +830,134 @@ class YouTubeDownloader:
             return None
 
         try:
-            loop = asyncio.get_event_loop()
-            info = await loop.run_in_executor(None, self._extract_info_sync, url)
+            loop = asyncio.get_running_loop()
+            info = await loop.run_in_executor(
+                self._meta_executor, self._extract_info_sync, url
+            )
 
             if info:
-                return self._parse_video_info(info)
+                video = self._parse_video_info(info)
+                self._cache_info(video.video_id, info)
+                return video
 
         except Exception as e:
-            logger.error(f"获取视频信息失败: {str(e)}")
+            logger.error("获取视频信息失败: %s", e)
 
         return None
 
-    def _extract_info_sync(self, url: str) -> Optional[Dict[str, Any]]:
-        """同步提取视频信息"""
-        try:
+    def _cache_info(self, video_id: str, info: Dict[str, Any]) -> None:
+        """缓存视频信息，只保留最近的少量条目"""
+        if not video_id:
+            return
+        if len(self._info_cache) >= max(16, settings.download_concurrency * 2):
+            self._info_cache.pop(next(iter(self._info_cache)))
+        self._info_cache[video_id] = (time.monotonic(), info)
+
+    def _peek_info(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """读取未过期的缓存视频信息（过期条目会被移除）"""
+        entry = self._info_cache.get(video_id)
+        if entry is None:
+            return None
+        cached_at, info = entry
+        if time.monotonic() - cached_at > _INFO_CACHE_TTL:
+            del self._info_cache[video_id]
+            return None
+        return info
+
+    def _pop_info(self, video_id: str) -> Optional[Dict[str, Any]]:
+        """取出未过期的缓存视频信息"""
+        info = self._peek_info(video_id)
+        if info is not None:
+            del self._info_cache[video_id]
+        return info
+
+    def _meta_ydl(self) -> "yt_dlp.YoutubeDL":
+        """获取当前线程的元数据用YoutubeDL实例（按线程懒创建，无需加锁）
+
+        cookies文件在外部被更新（如重新导出）后会重建实例，以加载新的cookies。
+        """
+        cookies_mtime = self._cookies_mtime()
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is not None and self._local.cookies_mtime != cookies_mtime:
+            # 关闭旧实例时不写回cookies，避免用旧cookies覆盖新文件
+            ydl.params["cookiefile"] = None
+            try:
+                ydl.close()
+            except Exception:
+                pass
+            self._ydl_instances.remove(ydl)
+            ydl = None
+
+        if ydl is None:
             ydl_opts = {
                 "quiet": True,
                 "no_warnings": True,
+                "skip_download": True,
             }
 
             # 如果配置了cookies文件，添加cookies支持
-            if self.cookies_file and Path(self.cookies_file).exists():
+            if cookies_mtime is not None:
                 ydl_opts["cookiefile"] = self.cookies_file
 
             # 如果配置了代理，添加代理支持
             if settings.proxy:
                 ydl_opts["proxy"] = settings.proxy
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                return ydl.extract_info(url, download=False)
+            ydl = yt_dlp.YoutubeDL(ydl_opts)
+            self._local.ydl = ydl
+            self._local.cookies_mtime = cookies_mtime
+            self._ydl_instances.append(ydl)
+        return ydl
+
+    def _cookies_mtime(self) -> Optional[int]:
+        """cookies文件的修改时间，未配置或文件不存在时返回None"""
+        if not self.cookies_file:
+            return None
+        try:
+            return os.stat(self.cookies_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def close(self) -> None:
+        """关闭元数据用YoutubeDL实例（会写回cookies文件）"""
+        _close_ydls(self._ydl_instances)
+
+    def _extract_info_sync(self, url: str) -> Optional[Dict[str, Any]]:
+        """同步提取视频信息"""
+        try:
+            return self._meta_ydl().extract_info(url, download=False)
 
         except Exception as e:
-            logger.error(f"提取视频信息失败: {str(e)}")
+            logger.error("提取视频信息失败: %s", e)
             return None
 
     def _parse_video_info(self, info: Dict[str, Any]) -> YouTubeVideo:
         """解析视频信息"""
+        g = info.get
 
-        # 解析发布时间
-        upload_date = info.get("upload_date")
-        if upload_date:
-            published_at = datetime.strptime(upload_date, "%Y%m%d")
+        # 解析发布时间（yt-dlp 的 upload_date 固定为 YYYYMMDD，直接切片比 strptime 快得多）
+        upload_date = g("upload_date")
+        if upload_date and len(upload_date) == 8 and upload_date.isdigit():
+            published_at = datetime(
+                int(upload_date[:4]), int(upload_date[4:6]), int(upload_date[6:8])
+            )
         else:
             published_at = datetime.now()
 
+        categories = g("categories")
         return YouTubeVideo(
-            video_id=info.get("id", ""),
-            title=info.get("title", ""),
-            description=info.get("description", ""),
-            channel_title=info.get("uploader", ""),
-            channel_id=info.get("channel_id", ""),
+            video_id=g("id", ""),
+            title=g("title", ""),
+            description=g("description", ""),
+            channel_title=g("uploader", ""),
+            channel_id=g("channel_id", ""),
             published_at=published_at,
-            duration=f"PT{info.get('duration', 0)}S",
-            view_count=info.get("view_count", 0),
-            like_count=info.get("like_count", 0),
-            comment_count=info.get("comment_count", 0),
-            thumbnail_url=info.get("thumbnail"),
-            tags=info.get("tags", []),
-            language=info.get("language", "en"),
-            category_id=str(info.get("categories", [""])[0])
-            if info.get("categories")
-            else None,
+            duration=f"PT{g('duration', 0)}S",
+            view_count=g("view_count", 0),
+            like_count=g("like_count", 0),
+            comment_count=g("comment_count", 0),
+            thumbnail_url=g("thumbnail"),
+            tags=g("tags", []),
+            language=g("language", "en"),
+            category_id=str(categories[0]) if categories else None,
         )
@@ -4,10 +4,83 @@ from datetime import datetime
 from typing import List, Optional
 import re
 
+# 文件夹名非法字符替换表（保留 | 作为作者名与视频ID的分隔符，所以不在替换列表中）
+_FOLDER_TRANS = str.maketrans({c: "_" for c in '/\\:*?"<>'})
+
+# ISO 8601 时长格式 (PT1H10M30S)
+_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+
+# 计算机科学相关关键词，编译为单个正则交替式，一次扫描即可判断
+_CS_KEYWORDS = (
+    "programming",
+    "coding",
+    "software",
+    "development",
+    "python",
+    "javascript",
+    "java",
+    "c++",
+    "algorithm",
+    "data structure",
+    "machine learning",
+    "ai",
+    "artificial intelligence",
+    "web development",
+    "frontend",
+    "backend",
+    "database",
+    "devops",
+    "docker",
+    "kubernetes",
+    "cloud",
+    "aws",
+    "azure",
+    "google cloud",
+    "cybersecurity",
+    "hacking",
+    "blockchain",
+    "cryptocurrency",
+    "game development",
+    "mobile app",
+    "ios",
+    "android",
+    "react",
+    "vue",
+    "angular",
+    "node.js",
+    "django",
+    "flask",
+    "tensorflow",
+    "pytorch",
+    "data science",
+    "analytics",
+    "big data",
+)
+_CS_RE = re.compile("|".join(map(re.escape, _CS_KEYWORDS)))
+
 
 class YouTubeVideo:
     """YouTube视频信息模型"""
 
+    __slots__ = (
+        "video_id",
+        "title",
+        "description",
+        "channel_title",
+        "channel_id",
+        "published_at",
+        "duration",
+        "view_count",
+        "like_count",
+        "comment_count",
+        "thumbnail_url",
+        "tags",
+        "language",
+        "category_id",
+        "downloaded_path",
+        "_folder_name",
+    )
+
     def __init__(self, **kwargs):
         # 设置默认值
         self.video_id: str = kwargs.get("video_id", "")
@@ -28,6 +101,9 @@ class YouTubeVideo:
         # 额外属性
         self.downloaded_path: Optional[str] = kwargs.get("downloaded_path")
 
+        # folder_name 的缓存（__slots__ 类无法使用 cached_property）
+        self._folder_name: Optional[str] = None
+
     @property
     def url(self) -> str:
         """获取视频URL"""
@@ -41,100 +117,38 @@ class YouTubeVideo:
     @property
     def folder_name(self) -> str:
         """获取视频文件夹名称 (格式: {作者名}|{视频ID})"""
-        # 清理作者名中的非法字符
-        safe_author = self._sanitize_for_folder(self.channel_title)
-        return f"{safe_author}|{self.video_id}"
+        if self._folder_name is None:
+            # 清理作者名中的非法字符
+            safe_author = self._sanitize_for_folder(self.channel_title)
+            self._folder_name = f"{safe_author}|{self.video_id}"
+        return self._folder_name
 
     def _sanitize_for_folder(self, name: str) -> str:
         """清理文件夹名称，移除非法字符"""
-        # 移除或替换非法字符（文件夹名中不能有 / \\ : * ? " < >）
-        # 注意：保留 | 作为分隔符，所以不在替换列表中
-        illegal_chars = '/\\:*?"<>'
-        for char in illegal_chars:
-            name = name.replace(char, "_")
-
-        # 限制长度
-        if len(name) > 50:
-            name = name[:50]
-
-        # 移除首尾空格和点
-        name = name.strip(". ")
+        # 替换非法字符（文件夹名中不能有 / \\ : * ? " < >）、限制长度、移除首尾空格和点
+        name = name.translate(_FOLDER_TRANS)[:50].strip(". ")
 
         return name or "Unknown"
 
     def is_computer_science_related(self) -> bool:
         """判断是否与计算机科学相关"""
-        cs_keywords = [
-            "programming",
-            "coding",
-            "software",
-            "development",
-            "python",
-            "javascript",
-            "java",
-            "c++",
-            "algorithm",
-            "data structure",
-            "machine learning",
-            "ai",
-            "artificial intelligence",
-            "web development",
-            "frontend",
-            "backend",
-            "database",
-            "devops",
-            "docker",
-            "kubernetes",
-            "cloud",
-            "aws",
-            "azure",
-            "google cloud",
-            "cybersecurity",
-            "hacking",
-            "blockchain",
-            "cryptocurrency",
-            "game development",
-            "mobile app",
-            "ios",
-            "android",
-            "react",
-            "vue",
-            "angular",
-            "node.js",
-            "django",
-            "flask",
-            "tensorflow",
-            "pytorch",
-            "data science",
-            "analytics",
-            "big data",
-        ]
-
         # 检查标题、描述和标签中的关键词
-        text_to_check = (
-            self.title.lower()
-            + " "
-            + self.description.lower()
-            + " "
-            + " ".join(self.tags).lower()
-        )
+        text_to_check = f"{self.title} {self.description} {' '.join(self.tags)}".lower()
 
-        return any(keyword in text_to_check for keyword in cs_keywords)
+        return _CS_RE.search(text_to_check) is not None
 
     def get_quality_score(self) -> float:
         """计算视频质量评分"""
-        if self.view_count == 0:
+        view_count = self.view_count
+        if view_count <= 0:
             return 0.0
 
         # 基础分数：观看量
-        base_score = min(self.view_count / 10000, 10.0)
+        base_score = min(view_count / 10000, 10.0)
 
         # 互动率加分
-        if self.view_count > 0:
-            engagement_rate = (self.like_count + self.comment_count) / self.view_count
-            engagement_bonus = min(engagement_rate * 100, 5.0)
-        else:
-            engagement_bonus = 0.0
+        engagement_rate = (self.like_count + self.comment_count) / view_count
+        engagement_bonus = min(engagement_rate * 100, 5.0)
 
         # 时长加分（10-30分钟最佳）
         duration_bonus = 0.0
@@ -149,11 +163,19 @@ class YouTubeVideo:
 
     def _parse_duration_minutes(self) -> int:
         """解析时长为分钟数"""
-        if not self.duration:
+        duration = self.duration
+        if not duration:
             return 0
 
+        # 快速路径：下载器生成的纯秒数格式 (PT630S)
+        if duration.startswith("PT") and duration.endswith("S"):
+            seconds = duration[2:-1]
+            if seconds.isdigit():
+                minutes, seconds = divmod(int(seconds), 60)
+                return minutes + (1 if seconds > 30 else 0)
+
         # 解析ISO 8601格式 (PT10M30S)
-        match = re.search(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?", self.duration)
+        match = _DURATION_RE.search(duration)
         if match:
             hours = int(match.group(1) or 0)
             minutes = int(match.group(2) or 0)
@@ -166,6 +188,18 @@ class YouTubeVideo:
 class YouTubeChannel:
     """YouTube频道信息模型"""
 
+    __slots__ = (
+        "channel_id",
+        "title",
+        "description",
+        "subscriber_count",
+        "video_count",
+        "view_count",
+        "thumbnail_url",
+        "country",
+        "language",
+    )
+
     def __init__(self, **kwargs):
         self.channel_id: str = kwargs.get("channel_id", "")
         self.title: str = kwargs.get("title", "")
@@ -1,9 +1,17 @@
 """YouTube视频搜索模块"""
 
 import asyncio
+import copy
+import multiprocessing.util
 import re
 import json
-from typing import List, Optional, Dict, Any
+import os
+import sys
+from pathlib import Path
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Dict, List, Optional, Tuple, TypeVar
 from urllib.parse import urlencode, quote
 from datetime import datetime, timedelta
 
@@ -14,35 +22,282 @@ try:
 except ImportError:
     REQUESTS_AVAILABLE = False
 
+try:
+    import aiohttp
+
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import yt_dlp
+
+    YT_DLP_AVAILABLE = True
+except ImportError:
+    YT_DLP_AVAILABLE = False
+
 from ..utils.logger import logger
 from ..utils.config import settings
+from ..utils.process_pool import create_process_pool
 from .models import YouTubeVideo, YouTubeChannel
 
+_T = TypeVar("_T")
+
+# 解析API返回的ISO时间（如 "2024-01-01T00:00:00Z"）；Python 3.11起fromisoformat原生支持"Z"后缀
+if sys.version_info >= (3, 11):
+    _parse_iso_datetime = datetime.fromisoformat
+else:
+
+    def _parse_iso_datetime(value: str) -> datetime:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+# API响应的JSON解析函数（安装了orjson时使用更快的orjson，二者都接受bytes）
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# 视频URL中的视频ID（embed/ 和 youtu.be/ 形式都以 "/" 结尾，已被该模式覆盖）
+_VIDEO_ID_RE = re.compile(r"(?:v=|/)([0-9A-Za-z_-]{11})")
+
+# 频道URL格式（按优先级排列）
+_CHANNEL_URL_PATTERNS = (
+    re.compile(r"/@([\w-]+)"),  # @username
+    re.compile(r"/channel/(UC[\w-]+)"),  # /channel/UC...
+    re.compile(r"/c/([\w-]+)"),  # /c/username
+    re.compile(r"/user/([\w-]+)"),  # /user/username
+)
+
+# videos.list 接口单次请求最多支持的视频ID数
+_VIDEOS_LIST_MAX_IDS = 50
+
+# videos.list 只返回 _parse_video_item 用到的字段（服务端裁剪，减少传输和解析量）
+_VIDEO_ITEM_FIELDS = (
+    "items(id,"
+    "snippet(title,description,channelTitle,channelId,publishedAt,"
+    "thumbnails/high/url,tags,defaultLanguage,categoryId),"
+    "statistics(viewCount,likeCount,commentCount),"
+    "contentDetails/duration)"
+)
+
+# 一次搜索中同时进行的请求数（API请求/视频信息获取）
+_REQUEST_CONCURRENCY = 5
+
+# 视频元数据缓存的有效期（秒）和最大条目数
+_VIDEO_CACHE_TTL = 3600
+_VIDEO_CACHE_SIZE = 3000
+
+_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# 进程内按ydl_opts缓存的YoutubeDL实例（每个提取进程各自一份，进程退出时关闭）
+_worker_ydls: Dict[frozenset, Any] = {}
+
+
+def _close_worker_ydls() -> None:
+    """关闭提取进程中缓存的YoutubeDL实例（保存cookie等）"""
+    while _worker_ydls:
+        _, ydl = _worker_ydls.popitem()
+        try:
+            ydl.close()
+        except Exception:
+            pass
+
+
+def _init_extract_worker() -> None:
+    """提取进程初始化：进程退出时关闭缓存的YoutubeDL实例
+
+    进程池的工作进程不执行atexit回调，需通过multiprocessing的Finalize注册。
+    """
+    multiprocessing.util.Finalize(None, _close_worker_ydls, exitpriority=10)
+
+
+def _extract_info_sync(
+    url: str, ydl_opts: dict
+) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """同步提取视频信息（在提取进程中执行）
+
+    Returns:
+        (可pickle的info, 错误信息) 元组；提取进程没有可用的日志输出，
+        错误交由主进程记录
+    """
+    try:
+        key = frozenset(ydl_opts.items())
+        ydl = _worker_ydls.get(key)
+        if ydl is None:
+            ydl = _worker_ydls[key] = yt_dlp.YoutubeDL(ydl_opts)
+        info = ydl.extract_info(url, download=False)
+        return (ydl.sanitize_info(info) if info else None), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _entry_to_video(
+    entry: Dict[str, Any], channel_title: str, channel_id: str, published_at: datetime
+) -> YouTubeVideo:
+    """将extract_flat模式的频道条目转换为YouTubeVideo（缺失的频道信息使用频道默认值）"""
+    get = entry.get
+    return YouTubeVideo(
+        video_id=get("id", ""),
+        title=get("title", ""),
+        description=get("description", ""),
+        channel_title=get("uploader") or get("channel") or channel_title,
+        channel_id=get("channel_id") or channel_id,
+        published_at=published_at,
+        duration=None,  # extract_flat模式不包含时长
+        view_count=get("view_count") or 0,
+        like_count=0,
+        comment_count=0,
+        thumbnail_url=get("thumbnail"),
+        tags=[],
+        language="en",
+        category_id=None,
+    )
+
+
+_extract_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_extract_pool() -> ProcessPoolExecutor:
+    """获取yt-dlp信息提取进程池
+
+    yt-dlp的页面解析（正则、JSON）是持有GIL的纯Python代码，
+    放到多个进程中执行才能在并发提取时利用多核。
+    """
+    global _extract_pool
+    if _extract_pool is None:
+        _extract_pool = create_process_pool(
+            min(os.cpu_count() or 1, settings.ytdlp_concurrency or 4),
+            initializer=_init_extract_worker,
+        )
+    return _extract_pool
+
 
 class YouTubeSearcher:
     """YouTube视频搜索器"""
 
+    # 频道handle到频道ID的持久缓存（映射基本不变，频道改名后手动删除对应条目即可）
+    # 固定放在项目根目录，不随运行时的工作目录变化
+    CHANNEL_ID_CACHE_FILE = Path(__file__).parent.parent.parent / "channel_ids.json"
+
     def __init__(self) -> None:
         self.base_url = "https://www.youtube.com"
         self.api_key = settings.youtube_api_key
 
         if REQUESTS_AVAILABLE:
             self.session = requests.Session()
-            self.session.headers.update(
-                {
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-                }
-            )
+            self.session.headers.update({"User-Agent": _USER_AGENT})
         else:
             self.session = None
             logger.warning("requests模块不可用，搜索功能受限")
 
+        # 限制并发数的信号量（按名称，在事件循环中首次使用时创建，同一循环内各次搜索共享）
+        self._semaphores: Dict[
+            str, Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        ] = {}
+
+        # API请求使用的异步HTTP会话（仅在一次搜索期间存在，见 _api_client）
+        self._aclient: Optional["aiohttp.ClientSession"] = None
+        self._aclient_users = 0
+
+        # 按video_id缓存已解析的视频（按最近使用排序），避免重复请求API/yt-dlp
+        self._video_cache: Dict[str, Tuple[float, YouTubeVideo]] = {}
+
+        # 频道handle -> 频道ID（首次解析时从文件加载）
+        self._channel_ids: Optional[Dict[str, str]] = None
+
+    def _semaphore(self, name: str, value: int) -> asyncio.Semaphore:
+        """获取当前事件循环中名为name的信号量（不存在则创建）"""
+        loop = asyncio.get_running_loop()
+        entry = self._semaphores.get(name)
+        if entry is None or entry[0] is not loop:
+            entry = self._semaphores[name] = (loop, asyncio.Semaphore(value))
+        return entry[1]
+
+    async def _bounded(self, aw: Awaitable[_T]) -> _T:
+        """在并发信号量保护下等待aw"""
+        async with self._semaphore("request", _REQUEST_CONCURRENCY):
+            return await aw
+
+    def _cache_video(self, video: YouTubeVideo) -> None:
+        """缓存视频信息，超出容量时淘汰最久未使用的条目"""
+        if not video.video_id:
+            return
+        self._video_cache.pop(video.video_id, None)
+        if len(self._video_cache) >= _VIDEO_CACHE_SIZE:
+            self._video_cache.pop(next(iter(self._video_cache)))
+        # 存一份副本，调用方对返回对象的修改（如downloaded_path）不会污染缓存
+        self._video_cache[video.video_id] = (time.monotonic(), copy.copy(video))
+
+    def _cached_video(self, video_id: str) -> Optional[YouTubeVideo]:
+        """读取未过期的缓存视频（返回副本，过期条目会被移除）"""
+        entry = self._video_cache.pop(video_id, None)
+        if entry is None:
+            return None
+        cached_at, video = entry
+        if time.monotonic() - cached_at > _VIDEO_CACHE_TTL:
+            return None
+        # 重新插入到末尾，标记为最近使用
+        self._video_cache[video_id] = entry
+        return copy.copy(video)
+
+    @asynccontextmanager
+    async def _api_client(self) -> AsyncIterator[None]:
+        """在一次搜索期间共享同一个aiohttp会话（保持连接复用），最外层退出时关闭"""
+        if not AIOHTTP_AVAILABLE:
+            yield
+            return
+
+        if self._aclient is None:
+            # trust_env 与 requests 的默认行为一致：使用环境变量中的代理配置
+            self._aclient = aiohttp.ClientSession(
+                headers={"User-Agent": _USER_AGENT},
+                timeout=aiohttp.ClientTimeout(total=30),
+                trust_env=True,
+            )
+        self._aclient_users += 1
+        try:
+            yield
+        finally:
+            self._aclient_users -= 1
+            if self._aclient_users == 0:
+                aclient, self._aclient = self._aclient, None
+                await aclient.close()
+
+    async def _api_get_json(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """请求YouTube Data API并返回JSON
+
+        优先使用aiohttp异步请求，不阻塞事件循环；aiohttp不可用时
+        退回到在线程中执行的requests请求。
+        """
+        if self._aclient is not None:
+            async with self._aclient.get(url, params=params) as response:
+                response.raise_for_status()
+                return _json_loads(await response.read())
+
+        if AIOHTTP_AVAILABLE:
+            # 不在 _api_client 范围内调用时，临时创建一个会话
+            async with self._api_client():
+                return await self._api_get_json(url, params)
+
+        if self.session is None:
+            raise RuntimeError("requests和aiohttp均不可用，无法请求YouTube API")
+
+        response = await asyncio.to_thread(self.session.get, url, params=params)
+        response.raise_for_status()
+        return _json_loads(response.content)
+
     async def search_trending_cs_videos(
         self, max_results: int = 20
     ) -> List[YouTubeVideo]:
         """搜索计算机领域热门视频"""
-        if self.api_key and REQUESTS_AVAILABLE:
-            return await self._search_with_api(max_results)
+        if self.api_key and (AIOHTTP_AVAILABLE or REQUESTS_AVAILABLE):
+            async with self._api_client():
+                return await self._search_with_api(max_results)
         else:
             return await self._search_with_scraping(max_results)
 
@@ -61,16 +316,30 @@ class YouTubeSearcher:
                 "coding interview",
             ]
 
-            all_videos = []
+            # 并发搜索各关键词（限制关键词数量），总耗时取决于最慢的一次请求
+            results = await asyncio.gather(
+                *(
+                    self._bounded(
+                        self._api_search_by_keyword(keyword, max_results // 3)
+                    )
+                    for keyword in keywords[:3]
+                ),
+                return_exceptions=True,
+            )
+
+            # 合并各关键词的视频ID并去重（保持顺序），统一批量获取详细信息
+            all_ids: Dict[str, None] = {}
+            for keyword, result in zip(keywords[:3], results, strict=True):
+                if isinstance(result, BaseException):
+                    logger.error(f"关键词搜索失败 {keyword}: {str(result)}")
+                    continue
+                all_ids.update(dict.fromkeys(result))
 
-            for keyword in keywords[:3]:  # 限制关键词数量
-                videos = await self._api_search_by_keyword(keyword, max_results // 3)
-                all_videos.extend(videos)
+            videos = await self._get_video_details(list(all_ids))
 
-            # 去重并按质量评分排序
-            unique_videos = self._deduplicate_videos(all_videos)
+            # 按质量评分排序
             sorted_videos = sorted(
-                unique_videos, key=lambda v: v.get_quality_score(), reverse=True
+                videos, key=lambda v: v.get_quality_score(), reverse=True
             )
 
             return sorted_videos[:max_results]
@@ -81,8 +350,8 @@ class YouTubeSearcher:
 
     async def _api_search_by_keyword(
         self, keyword: str, max_results: int
-    ) -> List[YouTubeVideo]:
-        """通过关键词搜索"""
+    ) -> List[str]:
+        """通过关键词搜索，返回视频ID列表"""
         try:
             # 搜索视频
             search_url = "https://www.googleapis.com/youtube/v3/search"
@@ -94,50 +363,65 @@ class YouTubeSearcher:
                 "maxResults": min(max_results, 50),
                 "publishedAfter": (datetime.now() - timedelta(days=30)).isoformat()
                 + "Z",
+                "fields": "items/id/videoId",
                 "key": self.api_key,
             }
 
-            response = self.session.get(search_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            video_ids = [item["id"]["videoId"] for item in data.get("items", [])]
+            data = await self._api_get_json(search_url, params)
 
-            if not video_ids:
-                return []
-
-            # 获取详细信息
-            return await self._get_video_details(video_ids)
+            return [item["id"]["videoId"] for item in data.get("items", [])]
 
         except Exception as e:
             logger.error(f"关键词搜索失败 {keyword}: {str(e)}")
             return []
 
     async def _get_video_details(self, video_ids: List[str]) -> List[YouTubeVideo]:
-        """获取视频详细信息"""
+        """获取视频详细信息（已缓存的视频不再请求API）"""
         try:
-            videos_url = "https://www.googleapis.com/youtube/v3/videos"
-            params = {
-                "part": "snippet,statistics,contentDetails",
-                "id": ",".join(video_ids),
-                "key": self.api_key,
-            }
-
-            response = self.session.get(videos_url, params=params)
-            response.raise_for_status()
-            data = response.json()
-
-            videos = []
-            for item in data.get("items", []):
-                try:
-                    video = self._parse_video_item(item)
-                    if video and video.is_computer_science_related():
-                        videos.append(video)
-                except Exception as e:
-                    logger.error(f"解析视频失败: {str(e)}")
-                    continue
-
-            return videos
+            found: Dict[str, YouTubeVideo] = {}
+            missing_ids = []
+            for video_id in video_ids:
+                video = self._cached_video(video_id)
+                if video is not None:
+                    found[video_id] = video
+                else:
+                    missing_ids.append(video_id)
+
+            if missing_ids:
+                videos_url = "https://www.googleapis.com/youtube/v3/videos"
+                # 每次请求最多50个ID，超出时分批并发请求
+                responses = await asyncio.gather(
+                    *(
+                        self._api_get_json(
+                            videos_url,
+                            {
+                                "part": "snippet,statistics,contentDetails",
+                                "id": ",".join(missing_ids[i : i + _VIDEOS_LIST_MAX_IDS]),
+                                "fields": _VIDEO_ITEM_FIELDS,
+                                "key": self.api_key,
+                            },
+                        )
+                        for i in range(0, len(missing_ids), _VIDEOS_LIST_MAX_IDS)
+                    )
+                )
+                items = [item for data in responses for item in data.get("items", [])]
+
+                for item in items:
+                    try:
+                        video = self._parse_video_item(item)
+                        if video:
+                            self._cache_video(video)
+                            found[video.video_id] = video
+                    except Exception as e:
+                        logger.error(f"解析视频失败: {str(e)}")
+                        continue
+
+            # 按请求顺序返回计算机相关视频
+            return [
+                found[video_id]
+                for video_id in video_ids
+                if video_id in found and found[video_id].is_computer_science_related()
+            ]
 
         except Exception as e:
             logger.error(f"获取视频详情失败: {str(e)}")
@@ -156,14 +440,12 @@ class YouTubeSearcher:
                 description=snippet["description"],
                 channel_title=snippet["channelTitle"],
                 channel_id=snippet["channelId"],
-                published_at=datetime.fromisoformat(
-                    snippet["publishedAt"].replace("Z", "+00:00")
-                ),
+                published_at=_parse_iso_datetime(snippet["publishedAt"]),
                 duration=content_details.get("duration"),
                 view_count=int(statistics.get("viewCount", 0)),
                 like_count=int(statistics.get("likeCount", 0)),
                 comment_count=int(statistics.get("commentCount", 0)),
-                thumbnail_url=snippet["thumbnails"].get("high", {}).get("url"),
+                thumbnail_url=snippet.get("thumbnails", {}).get("high", {}).get("url"),
                 tags=snippet.get("tags", []),
                 language=snippet.get("defaultLanguage", "en"),
                 category_id=snippet.get("categoryId"),
@@ -190,16 +472,23 @@ class YouTubeSearcher:
                 "SqcY0GlETPk",  # React Tutorial for Beginners
             ]
 
-            videos = []
+            # 并发提取各视频信息，结果保持原有顺序
+            video_ids = educational_video_ids[:max_results]
+            results = await asyncio.gather(
+                *(
+                    self._bounded(self._get_video_info_from_id(video_id))
+                    for video_id in video_ids
+                ),
+                return_exceptions=True,
+            )
 
-            for video_id in educational_video_ids[:max_results]:
-                try:
-                    video_info = await self._get_video_info_from_id(video_id)
-                    if video_info:
-                        videos.append(video_info)
-                except Exception as e:
-                    logger.debug(f"获取视频信息失败 {video_id}: {str(e)}")
+            videos = []
+            for video_id, video_info in zip(video_ids, results, strict=True):
+                if isinstance(video_info, BaseException):
+                    logger.debug(f"获取视频信息失败 {video_id}: {str(video_info)}")
                     continue
+                if video_info:
+                    videos.append(video_info)
 
             return videos
 
@@ -209,59 +498,67 @@ class YouTubeSearcher:
 
     async def _get_video_info_from_id(self, video_id: str) -> Optional[YouTubeVideo]:
         """从视频ID获取视频信息"""
+        video = self._cached_video(video_id)
+        if video is not None:
+            return video
+
+        if not YT_DLP_AVAILABLE:
+            logger.error("yt-dlp不可用")
+            return None
+
         try:
             # 使用yt-dlp获取视频信息
-            try:
-                import yt_dlp
-
-                ydl_opts = {
-                    "quiet": True,
-                    "no_warnings": True,
-                }
-
-                # 如果配置了代理，添加代理支持
-                if settings.proxy:
-                    ydl_opts["proxy"] = settings.proxy
-
-                loop = asyncio.get_event_loop()
-                info = await loop.run_in_executor(
-                    None,
-                    self._extract_info_sync,
-                    f"https://www.youtube.com/watch?v={video_id}",
-                    ydl_opts,
-                )
+            ydl_opts = {
+                "quiet": True,
+                "no_warnings": True,
+            }
 
-                if info:
-                    return self._parse_video_info_from_ytdlp(info)
+            # 如果配置了代理，添加代理支持
+            if settings.proxy:
+                ydl_opts["proxy"] = settings.proxy
 
-            except ImportError:
-                logger.error("yt-dlp不可用")
-                return None
+            info = await self._extract_info(
+                f"https://www.youtube.com/watch?v={video_id}",
+                ydl_opts,
+            )
+
+            if info:
+                video = self._parse_video_info_from_ytdlp(info)
+                if video:
+                    self._cache_video(video)
+                return video
 
         except Exception as e:
             logger.debug(f"获取视频信息失败: {str(e)}")
             return None
 
-    def _extract_info_sync(self, url: str, ydl_opts: dict) -> Optional[Dict[str, Any]]:
-        """同步提取视频信息"""
-        try:
-            import yt_dlp
+    async def _extract_info(
+        self, url: str, ydl_opts: dict
+    ) -> Optional[Dict[str, Any]]:
+        """在提取进程池中获取视频/频道信息
 
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                return ydl.extract_info(url, download=False)
-        except Exception as e:
-            logger.debug(f"提取信息失败: {str(e)}")
-            return None
+        所有yt-dlp提取都经过同一个信号量，限制同时发往YouTube的请求数，
+        避免大量并发触发限流。
+        """
+        async with self._semaphore("ytdlp", settings.ytdlp_concurrency or 4):
+            info, error = await asyncio.get_running_loop().run_in_executor(
+                _get_extract_pool(), _extract_info_sync, url, ydl_opts
+            )
+        if error:
+            logger.debug(f"提取信息失败: {error}")
+        return info
 
     def _parse_video_info_from_ytdlp(
         self, info: Dict[str, Any]
     ) -> Optional[YouTubeVideo]:
         """从yt-dlp信息解析视频数据"""
         try:
-            # 解析发布时间
+            # 解析发布时间（upload_date 固定为 YYYYMMDD，直接切片比 strptime 快得多）
             upload_date = info.get("upload_date")
-            if upload_date:
-                published_at = datetime.strptime(upload_date, "%Y%m%d")
+            if upload_date and len(upload_date) == 8 and upload_date.isdigit():
+                published_at = datetime(
+                    int(upload_date[:4]), int(upload_date[4:6]), int(upload_date[6:8])
+                )
             else:
                 published_at = datetime.now()
 
@@ -289,16 +586,11 @@ class YouTubeSearcher:
             return None
 
     def _deduplicate_videos(self, videos: List[YouTubeVideo]) -> List[YouTubeVideo]:
-        """去除重复视频"""
-        seen_ids = set()
-        unique_videos = []
-
+        """去除重复视频（保留首次出现的视频及其顺序）"""
+        unique_videos: Dict[str, YouTubeVideo] = {}
         for video in videos:
-            if video.video_id not in seen_ids:
-                seen_ids.add(video.video_id)
-                unique_videos.append(video)
-
-        return unique_videos
+            unique_videos.setdefault(video.video_id, video)
+        return list(unique_videos.values())
 
     async def get_video_info(self, video_url: str) -> Optional[YouTubeVideo]:
         """获取单个视频信息"""
@@ -306,8 +598,9 @@ class YouTubeSearcher:
         if not video_id:
             return None
 
-        if self.api_key and REQUESTS_AVAILABLE:
-            videos = await self._get_video_details([video_id])
+        if self.api_key and (AIOHTTP_AVAILABLE or REQUESTS_AVAILABLE):
+            async with self._api_client():
+                videos = await self._get_video_details([video_id])
             return videos[0] if videos else None
         else:
             # 返回模拟数据
@@ -330,18 +623,8 @@ class YouTubeSearcher:
 
     def _extract_video_id(self, url: str) -> Optional[str]:
         """从URL提取视频ID"""
-        patterns = [
-            r"(?:v=|\/)([0-9A-Za-z_-]{11}).*",
-            r"(?:embed\/)([0-9A-Za-z_-]{11})",
-            r"(?:youtu\.be\/)([0-9A-Za-z_-]{11})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-
-        return None
+        match = _VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
 
     async def search_by_channel(
         self,
@@ -362,13 +645,16 @@ class YouTubeSearcher:
         # 规范化频道标识符（支持 @username 格式）
         channel_identifier = self._normalize_channel_identifier(channel_id)
 
-        if self.api_key and REQUESTS_AVAILABLE:
+        if self.api_key and (AIOHTTP_AVAILABLE or REQUESTS_AVAILABLE):
             # 如果是handle格式，先转换为频道ID
             actual_channel_id = await self._resolve_channel_id(channel_identifier)
             if not actual_channel_id:
                 # 降级到yt-dlp
                 return await self._search_channel_by_ytdlp(channel_identifier, max_results)
-            return await self._search_channel_by_api(actual_channel_id, max_results, order)
+            async with self._api_client():
+                return await self._search_channel_by_api(
+                    actual_channel_id, max_results, order
+                )
         else:
             return await self._search_channel_by_ytdlp(channel_identifier, max_results)
 
@@ -384,14 +670,8 @@ class YouTubeSearcher:
         # 如果是完整URL，提取频道部分
         if channel_id.startswith("http"):
             # 匹配各种YouTube频道URL格式
-            patterns = [
-                r"/@([\w-]+)",  # @username
-                r"/channel/(UC[\w-]+)",  # /channel/UC...
-                r"/c/([\w-]+)",  # /c/username
-                r"/user/([\w-]+)",  # /user/username
-            ]
-            for pattern in patterns:
-                match = re.search(pattern, channel_id)
+            for pattern in _CHANNEL_URL_PATTERNS:
+                match = pattern.search(channel_id)
                 if match:
                     identifier = match.group(1)
                     # 如果不是以UC开头的频道ID，添加@前缀
@@ -411,13 +691,40 @@ class YouTubeSearcher:
         # 否则当作username处理，添加@前缀
         return f"@{channel_id}"
 
+    def _load_channel_ids(self) -> Dict[str, str]:
+        """加载频道ID缓存"""
+        if self._channel_ids is None:
+            self._channel_ids = {}
+            if self.CHANNEL_ID_CACHE_FILE.exists():
+                try:
+                    with open(self.CHANNEL_ID_CACHE_FILE, "r", encoding="utf-8") as f:
+                        self._channel_ids = dict(json.load(f))
+                except Exception as e:
+                    logger.warning(f"加载频道ID缓存失败: {e}")
+        return self._channel_ids
+
+    def _save_channel_ids(self) -> None:
+        """保存频道ID缓存（先写临时文件再替换，避免中断时损坏文件）"""
+        try:
+            tmp_path = self.CHANNEL_ID_CACHE_FILE.with_suffix(".json.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._channel_ids, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.CHANNEL_ID_CACHE_FILE)
+        except Exception as e:
+            logger.warning(f"保存频道ID缓存失败: {e}")
+
     async def _resolve_channel_id(self, channel_identifier: str) -> Optional[str]:
-        """将频道handle或用户名转换为频道ID"""
+        """将频道handle或用户名转换为频道ID（结果持久缓存）"""
         try:
             # 如果已经是频道ID，直接返回
             if channel_identifier.startswith("UC"):
                 return channel_identifier
 
+            channel_ids = self._load_channel_ids()
+            cached_id = channel_ids.get(channel_identifier)
+            if cached_id:
+                return cached_id
+
             # 构建频道URL
             if channel_identifier.startswith("@"):
                 channel_url = f"https://www.youtube.com/{channel_identifier}"
@@ -425,7 +732,8 @@ class YouTubeSearcher:
                 channel_url = f"https://www.youtube.com/c/{channel_identifier}"
 
             # 使用yt-dlp获取频道信息
-            import yt_dlp
+            if not YT_DLP_AVAILABLE:
+                return None
 
             ydl_opts = {
                 "quiet": True,
@@ -437,18 +745,16 @@ class YouTubeSearcher:
             if settings.proxy:
                 ydl_opts["proxy"] = settings.proxy
 
-            loop = asyncio.get_event_loop()
-            info = await loop.run_in_executor(
-                None,
-                self._extract_info_sync,
+            info = await self._extract_info(
                 channel_url,
                 ydl_opts,
             )
 
-            if info:
-                return info.get("channel_id")
-
-            return None
+            resolved_id = info.get("channel_id") if info else None
+            if resolved_id:
+                channel_ids[channel_identifier] = resolved_id
+                self._save_channel_ids()
+            return resolved_id
 
         except Exception as e:
             logger.debug(f"解析频道ID失败: {str(e)}")
@@ -467,12 +773,11 @@ class YouTubeSearcher:
             params = {
                 "part": "contentDetails",
                 "id": channel_id,
+                "fields": "items/contentDetails/relatedPlaylists/uploads",
                 "key": self.api_key,
             }
 
-            response = self.session.get(channel_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._api_get_json(channel_url, params)
 
             if not data.get("items"):
                 logger.error(f"未找到频道: {channel_id}")
@@ -487,12 +792,11 @@ class YouTubeSearcher:
                 "playlistId": uploads_playlist_id,
                 "maxResults": min(max_results, 50),
                 "order": order,
+                "fields": "items/contentDetails/videoId",
                 "key": self.api_key,
             }
 
-            response = self.session.get(playlist_url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await self._api_get_json(playlist_url, params)
 
             video_ids = [item["contentDetails"]["videoId"] for item in data.get("items", [])]
 
@@ -513,9 +817,11 @@ class YouTubeSearcher:
         max_results: int
     ) -> List[YouTubeVideo]:
         """使用yt-dlp获取频道视频"""
-        try:
-            import yt_dlp
+        if not YT_DLP_AVAILABLE:
+            logger.error("yt-dlp不可用")
+            return []
 
+        try:
             ydl_opts = {
                 "quiet": True,
                 "no_warnings": True,
@@ -536,10 +842,7 @@ class YouTubeSearcher:
                 # 用户名格式
                 channel_url = f"https://www.youtube.com/c/{channel_identifier}/videos"
 
-            loop = asyncio.get_event_loop()
-            info = await loop.run_in_executor(
-                None,
-                self._extract_info_sync,
+            info = await self._extract_info(
                 channel_url,
                 ydl_opts,
             )
@@ -552,35 +855,14 @@ class YouTubeSearcher:
             channel_title = info.get("uploader") or info.get("channel") or channel_identifier
             channel_id = info.get("channel_id") or channel_identifier
 
-            videos = []
-            for entry in info["entries"][:max_results]:
-                try:
-                    video = YouTubeVideo(
-                        video_id=entry.get("id", ""),
-                        title=entry.get("title", ""),
-                        description=entry.get("description", ""),
-                        channel_title=entry.get("uploader") or entry.get("channel") or channel_title,
-                        channel_id=entry.get("channel_id") or channel_id,
-                        published_at=datetime.now(),
-                        duration=None,  # extract_flat模式不包含时长
-                        view_count=entry.get("view_count") or 0,
-                        like_count=0,
-                        comment_count=0,
-                        thumbnail_url=entry.get("thumbnail"),
-                        tags=[],
-                        language="en",
-                        category_id=None,
-                    )
-                    videos.append(video)
-                except Exception as e:
-                    logger.debug(f"解析视频失败: {str(e)}")
-                    continue
-
-            return videos
+            # extract_flat模式不包含发布时间，统一使用当前时间
+            now = datetime.now()
+            return [
+                _entry_to_video(entry, channel_title, channel_id, now)
+                for entry in info["entries"][:max_results]
+                if entry
+            ]
 
-        except ImportError:
-            logger.error("yt-dlp不可用")
-            return []
         except Exception as e:
             import traceback
             logger.error(f"yt-dlp获取频道视频失败: {str(e)}\n{traceback.format_exc()}")
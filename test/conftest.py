@@ -0,0 +1,10 @@
+"""测试共享fixture"""
+import pytest
+
+from src.core.subtitle_processor import SubtitleProcessor
+
+
+@pytest.fixture(scope="session")
+def subtitle_processor():
+    """共享的字幕处理器实例（被测方法不修改处理器状态）"""
+    return SubtitleProcessor()
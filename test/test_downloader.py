@@ -0,0 +1,45 @@
+"""YouTube下载器测试"""
+import pytest
+
+from src.youtube.downloader import _vtt_to_srt
+
+
+class TestVttToSrt:
+    """VTT转SRT测试类"""
+
+    def test_convert(self, tmp_path):
+        """测试VTT转换为SRT"""
+        vtt = tmp_path / "video.en.vtt"
+        vtt.write_text(
+            "WEBVTT\n"
+            "Kind: captions\n"
+            "Language: en\n"
+            "\n"
+            "NOTE this is a comment\n"
+            "\n"
+            "00:00:01.000 --> 00:00:02.500 align:start position:0%\n"
+            "Hello<00:00:01.500><c> world</c>\n"
+            "\n"
+            "cue-2\n"
+            "01:02.000 --> 01:03.000\n"
+            "Tom &amp; Jerry\n"
+            "second line\n"
+            "\n"
+            "00:01:04.000 --> 00:01:05.000\n"
+            " \n",
+            encoding="utf-8",
+        )
+        srt = tmp_path / "en.srt"
+
+        assert _vtt_to_srt(str(vtt), str(srt)) == 2
+        assert srt.read_text(encoding="utf-8") == (
+            "1\n"
+            "00:00:01,000 --> 00:00:02,500\n"
+            "Hello world\n"
+            "\n"
+            "2\n"
+            "00:01:02,000 --> 00:01:03,000\n"
+            "Tom & Jerry\n"
+            "second line\n"
+            "\n"
+        )
@@ -7,7 +7,7 @@ from unittest.mock import Mock, patch, AsyncMock
 from src.core.video_processor import VideoProcessor
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def processor():
     """创建视频处理器实例"""
     return VideoProcessor()
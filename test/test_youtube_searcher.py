@@ -1,18 +1,37 @@
 """YouTube搜索器测试"""
 import pytest
 import asyncio
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, patch
 
 from src.youtube.searcher import YouTubeSearcher
 from src.youtube.models import YouTubeVideo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def searcher():
     """创建搜索器实例"""
     return YouTubeSearcher()
 
 
+@pytest.fixture(scope="module")
+def ytdlp_info():
+    """yt-dlp 提取结果样例（模块内只构造一次）"""
+    return {
+        "id": "test123",
+        "title": "Python Tutorial",
+        "description": "Learn Python",
+        "uploader": "Tech Channel",
+        "channel_id": "channel123",
+        "upload_date": "20240101",
+        "duration": 600,
+        "view_count": 10000,
+        "like_count": 500,
+        "comment_count": 100,
+        "tags": ["python"],
+        "categories": ["Education"],
+    }
+
+
 @pytest.fixture
 def sample_video():
     """示例视频数据"""
@@ -36,31 +55,22 @@ class TestYouTubeSearcher:
     """YouTube搜索器测试类"""
     
     @pytest.mark.asyncio
-    async def test_search_trending_cs_videos(self, searcher):
+    async def test_search_trending_cs_videos(self, ytdlp_info):
         """测试搜索CS热门视频"""
-        # 这里需要mock网络请求
-        with patch('requests.Session.get') as mock_get:
-            # 模拟响应
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.text = """
-            <html>
-                <div id="contents">
-                    <div id="dismissable1">
-                        <a id="video-title" href="/watch?v=test123">Python Tutorial</a>
-                        <a class="yt-simple-endpoint">Tech Channel</a>
-                        <span>10K views</span>
-                        <span>1 day ago</span>
-                    </div>
-                </div>
-            </html>
-            """
-            mock_get.return_value = mock_response
-            
+        # 该测试会写入视频缓存，使用独立实例避免影响共享的searcher
+        searcher = YouTubeSearcher()
+        # 直接mock yt-dlp提取层，避免网络请求和进程池开销
+        with patch.object(searcher, "api_key", None), \
+                patch("src.youtube.searcher.YT_DLP_AVAILABLE", True), \
+                patch.object(searcher, "_extract_info",
+                             AsyncMock(return_value=ytdlp_info)) as mock_extract:
             videos = await searcher.search_trending_cs_videos(max_results=5)
-            
-            assert len(videos) <= 5
-            # 更多的断言...
+
+        assert len(videos) == 5
+        assert mock_extract.await_count == 5
+        assert videos[0].title == "Python Tutorial"
+        assert videos[0].channel_title == "Tech Channel"
+        assert videos[0].view_count == 10000
     
     def test_parse_view_count(self, searcher):
         """测试观看次数解析"""
@@ -81,6 +91,18 @@ class TestYouTubeSearcher:
         time_3d_ago = searcher._parse_published_time("3 days ago")
         assert isinstance(time_3d_ago, datetime)
     
+    def test_parse_video_info_upload_date(self, searcher, ytdlp_info):
+        """测试yt-dlp信息中upload_date的解析（格式异常时不丢弃视频）"""
+        video = searcher._parse_video_info_from_ytdlp(ytdlp_info)
+        assert video.published_at.date().isoformat() == "2024-01-01"
+
+        for upload_date in (None, "", "2024-01-01", "NA"):
+            video = searcher._parse_video_info_from_ytdlp(
+                {**ytdlp_info, "upload_date": upload_date}
+            )
+            assert video is not None
+            assert video.video_id == "test123"
+
     def test_deduplicate_videos(self, searcher):
         """测试视频去重"""
         video1 = YouTubeVideo(
@@ -113,6 +135,26 @@ class TestYouTubeSearcher:
         unique_videos = searcher._deduplicate_videos([video1, video2, video3])
         assert len(unique_videos) == 2
         assert all(v.video_id in ["test1", "test2"] for v in unique_videos)
+        # 重复时保留首次出现的视频
+        assert unique_videos[0] is video1
+
+    def test_video_details_cache(self, sample_video):
+        """测试已缓存的视频不再请求API"""
+        # 该测试会修改缓存和实例方法，使用独立实例避免影响共享的searcher
+        searcher = YouTubeSearcher()
+        searcher._cache_video(sample_video)
+
+        async def fake_get_json(url, params):
+            assert params["id"] == "other"
+            return {"items": []}
+
+        searcher._api_get_json = fake_get_json
+        videos = asyncio.run(searcher._get_video_details(["test123", "other"]))
+
+        assert [v.video_id for v in videos] == ["test123"]
+        # 返回的是副本，修改不影响缓存
+        videos[0].downloaded_path = "/tmp/x.mp4"
+        assert searcher._cached_video("test123").downloaded_path != "/tmp/x.mp4"
 
 
 class TestYouTubeVideo:
@@ -140,6 +182,15 @@ class TestYouTubeVideo:
         assert 0 <= score <= 100
         assert isinstance(score, float)
     
+    def test_parse_duration_minutes(self):
+        """测试时长解析"""
+        assert YouTubeVideo(duration="PT10M30S")._parse_duration_minutes() == 10
+        assert YouTubeVideo(duration="PT1H5M45S")._parse_duration_minutes() == 66
+        # 下载器生成的纯秒数格式
+        assert YouTubeVideo(duration="PT630S")._parse_duration_minutes() == 10
+        assert YouTubeVideo(duration="PT645S")._parse_duration_minutes() == 11
+        assert YouTubeVideo()._parse_duration_minutes() == 0
+    
     def test_url_properties(self, sample_video):
         """测试URL属性"""
         assert sample_video.url == "https://www.youtube.com/watch?v=test123"